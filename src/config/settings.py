@@ -2,6 +2,7 @@
 Application settings management using QSettings.
 """
 
+from contextlib import contextmanager
 from pathlib import Path
 from PyQt6.QtCore import QSettings
 
@@ -81,3 +82,14 @@ class AppSettings:
     def sync(self):
         """Force sync settings to storage."""
         self._settings.sync()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several setting changes into a single write to storage.
+
+        Setters only update QSettings' in-memory copy; the block is
+        written out once, when it exits without an error.
+        """
+        yield self
+        self.sync()
@@ -1,20 +1,26 @@
 """PDF Toolkit core functionality."""
 
-from .pdf_handler import get_pdf_info, validate_pdf, PDFInfo
-from .merger import merge_pdfs, MergeOptions
-from .splitter import split_pdf, SplitMode, SplitOptions
-from .ocr_engine import (
-    OCROptions, OCRLanguage, OCRResult,
-    perform_ocr, extract_text_only,
-    check_tesseract_available, get_available_languages
-)
-from .compressor import compress_pdf, CompressionLevel, CompressionResult
-from .page_ops import rotate_pages, remove_pages, RotationAngle, PageOpResult
-from .encryption import encrypt_pdf, decrypt_pdf, EncryptionResult
-from .citation_extractor import (
-    extract_citation, to_bibtex, to_json,
-    CitationMetadata, CitationResult
-)
+import importlib
+
+# Submodules are imported on first attribute access, so e.g. importing
+# src.core.utils doesn't load PyMuPDF, pytesseract and Pillow as well
+_EXPORTS = {
+    'get_pdf_info': 'pdf_handler', 'validate_pdf': 'pdf_handler', 'PDFInfo': 'pdf_handler',
+    'merge_pdfs': 'merger', 'MergeOptions': 'merger',
+    'split_pdf': 'splitter', 'SplitMode': 'splitter', 'SplitOptions': 'splitter',
+    'OCROptions': 'ocr_engine', 'OCRLanguage': 'ocr_engine', 'OCRResult': 'ocr_engine',
+    'perform_ocr': 'ocr_engine', 'extract_text_only': 'ocr_engine',
+    'check_tesseract_available': 'ocr_engine', 'get_available_languages': 'ocr_engine',
+    'compress_pdf': 'compressor', 'CompressionLevel': 'compressor',
+    'CompressionResult': 'compressor',
+    'rotate_pages': 'page_ops', 'remove_pages': 'page_ops',
+    'RotationAngle': 'page_ops', 'PageOpResult': 'page_ops',
+    'encrypt_pdf': 'encryption', 'decrypt_pdf': 'encryption',
+    'EncryptionResult': 'encryption',
+    'extract_citation': 'citation_extractor', 'to_bibtex': 'citation_extractor',
+    'to_json': 'citation_extractor', 'CitationMetadata': 'citation_extractor',
+    'CitationResult': 'citation_extractor',
+}
 
 __all__ = [
     'get_pdf_info', 'validate_pdf', 'PDFInfo',
@@ -29,3 +35,10 @@ __all__ = [
     'extract_citation', 'to_bibtex', 'to_json',
     'CitationMetadata', 'CitationResult',
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
@@ -20,6 +20,16 @@ class CompressionLevel(Enum):
     MAXIMUM = "maximum"        # ~70-90% reduction, aggressive
 
 
+# Default zlib deflate level (1-9) for PDF streams per compression level.
+# Level 6 is the sweet spot; 9 only gains a fraction of a percent over it
+# at a noticeably higher cost, and 1 is much faster at a similar ratio.
+DEFAULT_DEFLATE_LEVELS = {
+    CompressionLevel.HIGH_QUALITY: 1,
+    CompressionLevel.BALANCED: 6,
+    CompressionLevel.MAXIMUM: 9,
+}
+
+
 @dataclass
 class CompressionResult:
     """Result of a compression operation."""
@@ -51,7 +61,9 @@ def compress_pdf(
     input_path: str,
     output_path: str,
     level: CompressionLevel = CompressionLevel.BALANCED,
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    deflate_level: int | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> CompressionResult:
     """
     Compress a PDF file to reduce its size.
@@ -61,6 +73,8 @@ def compress_pdf(
         output_path: Path for compressed output
         level: Desired compression level
         progress_callback: Optional callback(percent, message)
+        deflate_level: zlib level 1-9 for streams (default depends on level)
+        is_cancelled: Optional callable checked between pages; aborts when True
 
     Returns:
         CompressionResult with size information
@@ -84,6 +98,16 @@ def compress_pdf(
 
         # Process each page
         for page_num in range(total_pages):
+            if is_cancelled and is_cancelled():
+                doc.close()
+                return CompressionResult(
+                    output_path=Path(output_path),
+                    original_size=original_size,
+                    compressed_size=0,
+                    success=False,
+                    error_message="Annulleret"
+                )
+
             if progress_callback:
                 percent = 20 + int((page_num / total_pages) * 60)
                 progress_callback(percent, f"Komprimerer side {page_num + 1}/{total_pages}...")
@@ -100,15 +124,27 @@ def compress_pdf(
         if progress_callback:
             progress_callback(90, "Gemmer komprimeret fil...")
 
+        if deflate_level is None:
+            deflate_level = DEFAULT_DEFLATE_LEVELS[level]
+
         # Save with compression options
-        doc.save(
-            output_path,
+        save_options = dict(
             garbage=4,           # Maximum garbage collection (remove unused objects)
             deflate=True,        # Use deflate compression for streams
             deflate_images=True, # Compress images with deflate
             deflate_fonts=True,  # Compress fonts with deflate
             clean=True,          # Clean and sanitize content streams
         )
+        try:
+            # compression_effort is a percentage of zlib's maximum level
+            doc.save(
+                output_path,
+                compression_effort=_deflate_effort(deflate_level),
+                **save_options
+            )
+        except TypeError:
+            # Older PyMuPDF without compression_effort - use zlib default
+            doc.save(output_path, **save_options)
         doc.close()
 
         compressed_size = Path(output_path).stat().st_size
@@ -143,6 +179,12 @@ def compress_pdf(
         )
 
 
+def _deflate_effort(deflate_level: int) -> int:
+    """Map a zlib level (1-9) to PyMuPDF's compression_effort percentage."""
+    deflate_level = max(1, min(9, deflate_level))
+    return round(deflate_level * 100 / 9)
+
+
 def _get_compression_settings(level: CompressionLevel) -> dict:
     """Get compression settings for the specified level."""
     if level == CompressionLevel.HIGH_QUALITY:
@@ -97,7 +97,8 @@ def convert_docx_to_pdf(
 def convert_multiple_docx(
     input_files: list[str | Path],
     output_dir: str | Path | None = None,
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> list[ConvertResult]:
     """
     Convert multiple DOCX files to PDF.
@@ -106,14 +107,18 @@ def convert_multiple_docx(
         input_files: List of DOCX file paths
         output_dir: Output directory (uses input dir if None)
         progress_callback: Optional callback(percent, message)
+        is_cancelled: Optional callable checked between files; stops when True
 
     Returns:
-        List of ConvertResult for each file
+        List of ConvertResult for each converted file
     """
     results = []
     total = len(input_files)
 
     for i, input_path in enumerate(input_files):
+        if is_cancelled and is_cancelled():
+            break
+
         input_path = Path(input_path)
 
         if progress_callback:
@@ -2,6 +2,7 @@
 PDF encryption and password protection.
 """
 
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -24,6 +25,10 @@ PERM_COPY = fitz.PDF_PERM_COPY
 PERM_ANNOTATE = fitz.PDF_PERM_ANNOTATE
 PERM_ALL = PERM_PRINT | PERM_MODIFY | PERM_COPY | PERM_ANNOTATE
 
+# Encryption algorithms
+ENCRYPT_AES_128 = fitz.PDF_ENCRYPT_AES_128
+ENCRYPT_AES_256 = fitz.PDF_ENCRYPT_AES_256
+
 
 def encrypt_pdf(
     input_path: str,
@@ -31,7 +36,8 @@ def encrypt_pdf(
     user_password: str = "",
     owner_password: str = "",
     permissions: int = PERM_ALL,
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    algorithm: int = ENCRYPT_AES_256
 ) -> EncryptionResult:
     """
     Encrypt a PDF with password protection.
@@ -43,6 +49,7 @@ def encrypt_pdf(
         owner_password: Password for full access (required)
         permissions: Permission flags (use PERM_* constants)
         progress_callback: Optional callback(percent, message)
+        algorithm: ENCRYPT_AES_256 (default) or ENCRYPT_AES_128
 
     Returns:
         EncryptionResult with operation info
@@ -63,20 +70,15 @@ def encrypt_pdf(
         if progress_callback:
             progress_callback(50, "Krypterer dokument...")
 
-        # Set encryption
-        encrypt_dict = {
-            "owner": owner_password,
-            "user": user_password,
-            "encryption": fitz.PDF_ENCRYPT_AES_256,  # Strong encryption
-            "permissions": permissions,
-        }
-
         if progress_callback:
             progress_callback(80, "Gemmer krypteret fil...")
 
+        # Streams are AES-encrypted natively by MuPDF while writing. AES-256
+        # (revision 6) uses the file key for every object as-is, unlike the
+        # MD5-derived per-object keys of the AES-128 (revision 4) handler.
         doc.save(
             output_path,
-            encryption=fitz.PDF_ENCRYPT_AES_256,
+            encryption=algorithm,
             owner_pw=owner_password,
             user_pw=user_password,
             permissions=permissions,
@@ -172,6 +174,27 @@ def decrypt_pdf(
         )
 
 
+def copy_pdf(input_path: str, output_path: str) -> EncryptionResult:
+    """
+    Copy a PDF unchanged, e.g. in place of decrypting an unencrypted file.
+
+    shutil.copyfile uses the OS fast-copy path (sendfile on Linux,
+    CopyFileEx on Windows) instead of a userspace read/write loop.
+
+    Returns:
+        EncryptionResult with operation info
+    """
+    try:
+        shutil.copyfile(input_path, output_path)
+        return EncryptionResult(output_path=Path(output_path), success=True)
+    except OSError as e:
+        return EncryptionResult(
+            output_path=Path(output_path),
+            success=False,
+            error_message=str(e)
+        )
+
+
 def is_pdf_encrypted(pdf_path: str) -> tuple[bool, bool]:
     """
     Check if a PDF is encrypted.
@@ -69,17 +69,16 @@ def merge_pdfs(
             progress_callback(percent, f"Behandler {pdf_path.name}...")
 
         try:
-            src_doc = fitz.open(pdf_path)
+            # Opened by path: MuPDF reads objects on demand, and the context
+            # manager frees each source as soon as its pages are copied
+            with fitz.open(pdf_path) as src_doc:
+                # Copy metadata from first file if requested
+                if i == 0 and options.preserve_metadata_from_first:
+                    output_doc.set_metadata(src_doc.metadata)
 
-            # Copy metadata from first file if requested
-            if i == 0 and options.preserve_metadata_from_first:
-                output_doc.set_metadata(src_doc.metadata)
-
-            # Insert all pages from source
-            output_doc.insert_pdf(src_doc)
-            total_pages += len(src_doc)
-
-            src_doc.close()
+                # Insert all pages from source
+                output_doc.insert_pdf(src_doc)
+                total_pages += len(src_doc)
 
         except Exception as e:
             output_doc.close()
@@ -133,14 +132,14 @@ def merge_page_ranges(
             percent = int((i / file_count) * 100)
             progress_callback(percent, f"Behandler {pdf_path.name}...")
 
-        src_doc = fitz.open(pdf_path)
-        pages = parse_page_ranges(page_range, len(src_doc))
-
-        for page_num in pages:
-            output_doc.insert_pdf(src_doc, from_page=page_num, to_page=page_num)
-            total_pages += 1
+        with fitz.open(pdf_path) as src_doc:
+            pages = parse_page_ranges(page_range, len(src_doc))
 
-        src_doc.close()
+            # One insert per contiguous run instead of per page, so shared
+            # resources (fonts, images) are grafted once per run
+            for start, end in _contiguous_runs(pages):
+                output_doc.insert_pdf(src_doc, from_page=start, to_page=end)
+            total_pages += len(pages)
 
     if progress_callback:
         progress_callback(95, "Gemmer fil...")
@@ -156,3 +155,14 @@ def merge_page_ranges(
         total_pages=total_pages,
         source_files=file_count
     )
+
+
+def _contiguous_runs(pages: list[int]) -> list[tuple[int, int]]:
+    """Collapse a sorted page list into inclusive (start, end) runs."""
+    runs = []
+    for page in pages:
+        if runs and page == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
@@ -3,7 +3,13 @@ OCR processing engine using Tesseract.
 Converts scanned PDFs and images to searchable PDFs.
 """
 
+import functools
+import io
 import os
+import shutil
+import subprocess
+import tempfile
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -25,6 +31,23 @@ try:
 except ImportError:
     HAS_PDF2IMAGE = False
 
+# In-process Tesseract API - keeps models loaded between pages/calls
+try:
+    import tesserocr
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+# One TessServer per (language, tessdata path), created on first use
+_tess_servers: dict[tuple[str, str], "TessServer"] = {}
+_tess_servers_lock = threading.Lock()
+
+# How often a running Tesseract process checks for cancellation (seconds)
+_CANCEL_POLL_INTERVAL = 0.2
+
+# Cancellation event of the OCR process pool this worker belongs to
+_pool_cancel_event = None
+
 
 class OCRLanguage(Enum):
     """Supported OCR languages."""
@@ -51,10 +74,26 @@ class OCRResult:
     error_message: str = ""
 
 
+def _mtime(path: str) -> float:
+    """Modification time of a path, or 0 if it doesn't exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+
+def _tesseract_binary() -> str:
+    """Resolve the configured Tesseract command to a file path ("" if not found)."""
+    cmd = pytesseract.pytesseract.tesseract_cmd
+    return cmd if os.path.isabs(cmd) else (shutil.which(cmd) or "")
+
+
 def check_tesseract_available(tesseract_path: str = "") -> tuple[bool, str]:
     """
     Check if Tesseract OCR is available.
 
+    The result is cached until the Tesseract binary changes on disk.
+
     Returns:
         Tuple of (is_available, message)
     """
@@ -65,6 +104,13 @@ def check_tesseract_available(tesseract_path: str = "") -> tuple[bool, str]:
     if tesseract_path and os.path.exists(tesseract_path):
         pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
+    binary = _tesseract_binary()
+    return _check_tesseract_cached(pytesseract.pytesseract.tesseract_cmd, binary, _mtime(binary))
+
+
+@functools.lru_cache(maxsize=8)
+def _check_tesseract_cached(cmd: str, binary: str, binary_mtime: float) -> tuple[bool, str]:
+    """Run `tesseract --version` once per command/binary version."""
     try:
         version = pytesseract.get_tesseract_version()
         return True, f"Tesseract {version} fundet"
@@ -73,18 +119,190 @@ def check_tesseract_available(tesseract_path: str = "") -> tuple[bool, str]:
 
 
 def get_available_languages(tesseract_path: str = "") -> list[str]:
-    """Get list of available Tesseract languages."""
+    """
+    Get list of available Tesseract languages.
+
+    Cached until the binary or its tessdata folder changes on disk.
+    """
     if not HAS_TESSERACT:
         return []
 
     if tesseract_path and os.path.exists(tesseract_path):
         pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
+    binary = _tesseract_binary()
+    tessdata = os.environ.get("TESSDATA_PREFIX") or os.path.join(os.path.dirname(binary), "tessdata")
+    return list(_languages_cached(
+        pytesseract.pytesseract.tesseract_cmd, binary, _mtime(binary), _mtime(tessdata)
+    ))
+
+
+@functools.lru_cache(maxsize=8)
+def _languages_cached(cmd: str, binary: str, binary_mtime: float,
+                      tessdata_mtime: float) -> tuple[str, ...]:
+    """Run `tesseract --list-langs` once per command/binary/tessdata version."""
     try:
         langs = pytesseract.get_languages()
-        return [l for l in langs if l != 'osd']  # Remove orientation detection
+        return tuple(l for l in langs if l != 'osd')  # Remove orientation detection
     except Exception:
-        return []
+        return ()
+
+
+class TessServer:
+    """
+    A long-lived, initialized Tesseract engine (LSTM only, automatic layout).
+
+    Loading the LSTM model is the expensive part of a Tesseract run, so it
+    happens once per process and language; pages are then recognized one
+    at a time under a lock, as TessBaseAPI is not thread-safe.
+    """
+
+    def __init__(self, lang: str, tessdata_path: str = ""):
+        kwargs = {"path": tessdata_path} if tessdata_path else {}
+        self.api = tesserocr.PyTessBaseAPI(
+            lang=lang, oem=tesserocr.OEM.LSTM_ONLY, psm=tesserocr.PSM.AUTO, **kwargs
+        )
+        self._lock = threading.Lock()
+
+    def recognize(self, img: "Image.Image") -> str:
+        """Recognize plain text in an image."""
+        with self._lock:
+            self.api.SetImage(img)
+            return self.api.GetUTF8Text()
+
+
+def get_tess_server(lang: str, tessdata_path: str = "") -> TessServer:
+    """Return the shared TessServer for a language, creating it on first use."""
+    key = (lang, tessdata_path)
+    with _tess_servers_lock:
+        server = _tess_servers.get(key)
+        if server is None:
+            server = _tess_servers[key] = TessServer(lang, tessdata_path)
+        return server
+
+
+def _tessdata_path() -> str:
+    """Locate tessdata next to a configured Tesseract binary ("" = library default)."""
+    cmd = pytesseract.pytesseract.tesseract_cmd
+    if os.path.isabs(cmd):
+        tessdata = os.path.join(os.path.dirname(cmd), "tessdata")
+        if os.path.isdir(tessdata):
+            return tessdata + os.sep
+    return ""
+
+
+def _image_to_text(
+    img: "Image.Image",
+    lang: str,
+    is_cancelled: Callable[[], bool] | None = None
+) -> str:
+    """
+    Recognize plain text in an image.
+
+    Uses tesserocr when installed so the language model stays loaded;
+    otherwise pipes the image through a Tesseract subprocess.
+    """
+    if HAS_TESSEROCR:
+        try:
+            server = get_tess_server(lang, _tessdata_path())
+        except RuntimeError:
+            pass  # Language data not found by tesserocr - use the CLI
+        else:
+            return server.recognize(img)
+
+    return _tesseract_pipe(_ppm_bytes(img), lang, is_cancelled)
+
+
+def _ppm_bytes(img: "Image.Image") -> bytes:
+    """Encode an image as uncompressed PPM (no PNG deflate/inflate, no temp files)."""
+    buf = io.BytesIO()
+    img.save(buf, format="PPM")
+    return buf.getvalue()
+
+
+def _run_tesseract(
+    args: list[str],
+    image_bytes: bytes,
+    is_cancelled: Callable[[], bool] | None = None
+) -> bytes:
+    """
+    Run Tesseract with an encoded image on stdin, returning its stdout.
+
+    The process is killed as soon as is_cancelled() returns True.
+    """
+    proc = subprocess.Popen(
+        [pytesseract.pytesseract.tesseract_cmd, "stdin", *args],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)  # No console on Windows
+    )
+    stdin_data = image_bytes
+    while True:
+        try:
+            stdout, stderr = proc.communicate(stdin_data, timeout=_CANCEL_POLL_INTERVAL)
+            break
+        except subprocess.TimeoutExpired:
+            stdin_data = None  # Already handed over; retries only collect output
+            if is_cancelled and is_cancelled():
+                proc.kill()
+                proc.communicate()
+                raise RuntimeError("OCR annulleret")
+
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode("utf-8", errors="replace").strip())
+    return stdout
+
+
+def _tesseract_pipe(
+    image_bytes: bytes,
+    lang: str,
+    is_cancelled: Callable[[], bool] | None = None
+) -> str:
+    """Run `tesseract stdin stdout` on an encoded image, returning its text."""
+    return _run_tesseract(["stdout", "-l", lang], image_bytes, is_cancelled).decode("utf-8")
+
+
+def _image_to_pdf_and_text(
+    img: "Image.Image",
+    lang: str,
+    dpi: int,
+    is_cancelled: Callable[[], bool] | None = None
+) -> tuple[bytes, str]:
+    """
+    Recognize an image once, producing both a searchable PDF page and its text.
+
+    Tesseract's `pdf` and `txt` configs share a single recognition pass, so
+    the page is no longer OCR'ed a second time just for the plain text.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        outbase = os.path.join(tmp, "page")
+        _run_tesseract(
+            [outbase, "-l", lang, "--dpi", str(dpi), "pdf", "txt"],
+            _ppm_bytes(img),
+            is_cancelled
+        )
+        with open(outbase + ".pdf", "rb") as f:
+            pdf_bytes = f.read()
+        with open(outbase + ".txt", encoding="utf-8") as f:
+            text = f.read()
+    return pdf_bytes, text
+
+
+def init_ocr_pool_worker(cancel_event):
+    """
+    Initializer for OCR process pool workers.
+
+    Limits Tesseract to a single OpenMP thread (with one file per process,
+    its own threading would only oversubscribe the cores) and keeps the
+    pool's cancellation event for run_ocr_pool_job.
+
+    Args:
+        cancel_event: multiprocessing Event set when the batch is cancelled
+    """
+    global _pool_cancel_event
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _pool_cancel_event = cancel_event
 
 
 def is_scanned_pdf(pdf_path: str) -> bool:
@@ -112,7 +330,8 @@ def perform_ocr(
     output_path: str,
     options: OCROptions,
     tesseract_path: str = "",
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> OCRResult:
     """
     Perform OCR on a PDF or image file.
@@ -123,6 +342,8 @@ def perform_ocr(
         options: OCR processing options
         tesseract_path: Optional custom Tesseract path
         progress_callback: Optional callback(percent, message)
+        is_cancelled: Optional callable; when True the running Tesseract
+            process is killed and no further pages are processed
 
     Returns:
         OCRResult with processing information
@@ -144,9 +365,9 @@ def perform_ocr(
 
     try:
         if input_ext == '.pdf':
-            return _ocr_pdf(input_path, output_path, options, progress_callback)
+            return _ocr_pdf(input_path, output_path, options, progress_callback, is_cancelled)
         elif input_ext in ['.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp']:
-            return _ocr_image(input_path, output_path, options, progress_callback)
+            return _ocr_image(input_path, output_path, options, progress_callback, is_cancelled)
         else:
             return OCRResult(
                 output_path=Path(output_path),
@@ -169,7 +390,8 @@ def _ocr_pdf(
     input_path: str,
     output_path: str,
     options: OCROptions,
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> OCRResult:
     """Perform OCR on a PDF file using Tesseract's PDF output."""
 
@@ -179,6 +401,10 @@ def _ocr_pdf(
     pdf_pages = []
 
     for page_num, page in enumerate(doc):
+        if is_cancelled and is_cancelled():
+            doc.close()
+            raise RuntimeError("OCR annulleret")
+
         if progress_callback:
             percent = int((page_num / total_pages) * 85)
             progress_callback(percent, f"Behandler side {page_num + 1}/{total_pages}...")
@@ -190,20 +416,11 @@ def _ocr_pdf(
         # Convert to PIL Image for Tesseract
         img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
 
-        lang = options.language.value
-
-        # Get plain text for result
-        page_text = pytesseract.image_to_string(img, lang=lang)
-        all_text.append(page_text)
-
-        # Generate searchable PDF page using Tesseract
-        # This creates a PDF with invisible text layer properly
-        pdf_bytes = pytesseract.image_to_pdf_or_hocr(
-            img,
-            lang=lang,
-            extension='pdf',
-            config=f'--dpi {options.dpi}'
+        # Searchable PDF page (invisible text layer) and plain text in one pass
+        pdf_bytes, page_text = _image_to_pdf_and_text(
+            img, options.language.value, options.dpi, is_cancelled
         )
+        all_text.append(page_text)
         pdf_pages.append(pdf_bytes)
 
     doc.close()
@@ -245,7 +462,8 @@ def _ocr_image(
     input_path: str,
     output_path: str,
     options: OCROptions,
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> OCRResult:
     """Perform OCR on an image file and create a searchable PDF."""
 
@@ -262,21 +480,9 @@ def _ocr_image(
     if progress_callback:
         progress_callback(30, "Udfører OCR...")
 
-    lang = options.language.value
-
-    # Get plain text for result
-    page_text = pytesseract.image_to_string(img, lang=lang)
-
-    if progress_callback:
-        progress_callback(60, "Opretter søgbar PDF...")
-
-    # Generate searchable PDF directly using Tesseract
-    # This creates a PDF with proper invisible text layer
-    pdf_bytes = pytesseract.image_to_pdf_or_hocr(
-        img,
-        lang=lang,
-        extension='pdf',
-        config=f'--dpi {options.dpi}'
+    # Searchable PDF (invisible text layer) and plain text in one pass
+    pdf_bytes, page_text = _image_to_pdf_and_text(
+        img, options.language.value, options.dpi, is_cancelled
     )
 
     if progress_callback:
@@ -301,7 +507,8 @@ def extract_text_only(
     input_path: str,
     options: OCROptions,
     tesseract_path: str = "",
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> tuple[str, bool, str]:
     """
     Extract text from PDF or image without creating searchable PDF.
@@ -324,6 +531,10 @@ def extract_text_only(
             all_text = []
 
             for page_num, page in enumerate(doc):
+                if is_cancelled and is_cancelled():
+                    doc.close()
+                    return "\n\n".join(all_text), False, "OCR annulleret"
+
                 if progress_callback:
                     percent = int((page_num / doc.page_count) * 90)
                     progress_callback(percent, f"Side {page_num + 1}/{doc.page_count}...")
@@ -332,7 +543,7 @@ def extract_text_only(
                 pix = page.get_pixmap(matrix=mat)
                 img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
 
-                text = pytesseract.image_to_string(img, lang=lang)
+                text = _image_to_text(img, lang, is_cancelled)
                 all_text.append(text)
 
             doc.close()
@@ -346,7 +557,7 @@ def extract_text_only(
             if img.mode != 'RGB':
                 img = img.convert('RGB')
 
-            text = pytesseract.image_to_string(img, lang=lang)
+            text = _image_to_text(img, lang, is_cancelled)
             return text, True, ""
 
         else:
@@ -354,3 +565,68 @@ def extract_text_only(
 
     except Exception as e:
         return "", False, str(e)
+
+
+def run_ocr_job(
+    input_path: str,
+    output_path: str,
+    options: OCROptions,
+    tesseract_path: str = "",
+    extract_only: bool = False,
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
+) -> OCRResult:
+    """
+    Run OCR or text-only extraction on a single file.
+
+    Module-level so it can be submitted to a process pool.
+
+    Returns:
+        OCRResult (output_path is unused when extract_only is set)
+    """
+    if extract_only:
+        text, success, error = extract_text_only(
+            input_path,
+            options,
+            tesseract_path,
+            progress_callback,
+            is_cancelled
+        )
+        return OCRResult(
+            output_path=Path(output_path),
+            pages_processed=1,
+            text_extracted=text,
+            success=success,
+            error_message=error
+        )
+
+    return perform_ocr(
+        input_path,
+        output_path,
+        options,
+        tesseract_path,
+        progress_callback,
+        is_cancelled
+    )
+
+
+def run_ocr_pool_job(
+    input_path: str,
+    output_path: str,
+    options: OCROptions,
+    tesseract_path: str = "",
+    extract_only: bool = False
+) -> OCRResult:
+    """
+    Run an OCR job in a worker started with init_ocr_pool_worker.
+
+    A running Tesseract process is killed once the pool's event is set.
+    """
+    return run_ocr_job(
+        input_path,
+        output_path,
+        options,
+        tesseract_path,
+        extract_only,
+        is_cancelled=_pool_cancel_event.is_set
+    )
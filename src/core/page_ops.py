@@ -6,7 +6,7 @@ Includes rotation, removal, and reordering of pages.
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
 import fitz  # PyMuPDF
 
@@ -27,6 +27,16 @@ class PageOpResult:
     error_message: str = ""
 
 
+@dataclass
+class PageThumbnail:
+    """Raw RGB pixels of one page thumbnail (no image encoding)."""
+    page_num: int  # 1-indexed
+    width: int
+    height: int
+    stride: int
+    samples: bytes
+
+
 def rotate_pages(
     input_path: str,
     output_path: str,
@@ -56,10 +66,10 @@ def rotate_pages(
 
         # Determine which pages to rotate
         if page_numbers is None:
-            pages_to_rotate = list(range(total_pages))
+            pages_to_rotate = range(total_pages)
         else:
-            # Convert 1-indexed to 0-indexed
-            pages_to_rotate = [p - 1 for p in page_numbers if 0 < p <= total_pages]
+            # Convert 1-indexed to 0-indexed; a page listed twice rotates once
+            pages_to_rotate = sorted({p - 1 for p in page_numbers if 0 < p <= total_pages})
 
         if progress_callback:
             progress_callback(20, "Roterer sider...")
@@ -77,7 +87,9 @@ def rotate_pages(
         if progress_callback:
             progress_callback(95, "Gemmer fil...")
 
-        doc.save(output_path, garbage=4, deflate=True)
+        # Rotation only edits each page's /Rotate key and creates no duplicate
+        # objects, so skip the costly stream-deduplicating garbage levels
+        doc.save(output_path, garbage=1, deflate=True)
         doc.close()
 
         if progress_callback:
@@ -101,7 +113,7 @@ def rotate_pages(
 def remove_pages(
     input_path: str,
     output_path: str,
-    page_numbers: list[int],
+    page_numbers: Iterable[int],
     progress_callback: Callable[[int, str], None] | None = None
 ) -> PageOpResult:
     """
@@ -110,7 +122,7 @@ def remove_pages(
     Args:
         input_path: Path to input PDF
         output_path: Path for output PDF
-        page_numbers: List of page numbers to remove (1-indexed)
+        page_numbers: Page numbers to remove (1-indexed), any iterable of ints
         progress_callback: Optional callback(percent, message)
 
     Returns:
@@ -256,42 +268,73 @@ def extract_pages(
         )
 
 
+def _render_thumbnail(page: fitz.Page, max_size: int) -> PageThumbnail:
+    """Render one page scaled to fit max_size, as raw RGB pixels."""
+    # Calculate scale to fit max_size
+    rect = page.rect
+    scale = max_size / max(rect.width, rect.height)
+    mat = fitz.Matrix(scale, scale)
+
+    # Render to pixmap; only the copied samples outlive this call
+    pix = page.get_pixmap(matrix=mat, alpha=False)
+    return PageThumbnail(page.number + 1, pix.width, pix.height, pix.stride, pix.samples)
+
+
 def get_page_thumbnails(
     pdf_path: str,
     max_size: int = 150
-) -> list[tuple[int, bytes]]:
+) -> Iterator[PageThumbnail]:
     """
-    Generate thumbnail images for each page.
+    Generate thumbnail images for each page, one page at a time.
 
     Args:
         pdf_path: Path to PDF file
         max_size: Maximum dimension for thumbnails
 
-    Returns:
-        List of (page_number, png_bytes) tuples (1-indexed page numbers)
+    Yields:
+        PageThumbnail per page, in page order
     """
-    thumbnails = []
-
     try:
         doc = fitz.open(pdf_path)
+    except Exception:
+        return
 
+    # Closing the generator early (e.g. on cancel) still closes the document
+    try:
         for page_num in range(doc.page_count):
-            page = doc[page_num]
+            yield _render_thumbnail(doc[page_num], max_size)
+
+    except Exception:
+        pass
 
-            # Calculate scale to fit max_size
-            rect = page.rect
-            scale = max_size / max(rect.width, rect.height)
-            mat = fitz.Matrix(scale, scale)
+    finally:
+        doc.close()
+        # Drop decoded fonts/images MuPDF keeps in its global store
+        fitz.TOOLS.store_shrink(100)
 
-            # Render to pixmap
-            pix = page.get_pixmap(matrix=mat)
-            png_bytes = pix.tobytes("png")
 
-            thumbnails.append((page_num + 1, png_bytes))
+def render_thumbnail_range(
+    pdf_path: str,
+    start: int,
+    stop: int,
+    max_size: int = 150
+) -> list[PageThumbnail]:
+    """
+    Render thumbnails for a block of pages with a single document open.
 
-        doc.close()
+    Module-level so blocks can be rendered in parallel in a process pool.
 
-    except Exception:
-        pass
+    Args:
+        pdf_path: Path to PDF file
+        start: First page (0-indexed, inclusive)
+        stop: Last page (0-indexed, exclusive)
+        max_size: Maximum dimension for thumbnails
 
-    return thumbnails
+    Returns:
+        List of PageThumbnail, in page order
+    """
+    with fitz.open(pdf_path) as doc:
+        return [
+            _render_thumbnail(doc[page_num], max_size)
+            for page_num in range(start, min(stop, doc.page_count))
+        ]
@@ -2,6 +2,8 @@
 Base PDF operations using PyMuPDF.
 """
 
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from io import BytesIO
@@ -25,6 +27,10 @@ def get_pdf_info(path: str | Path) -> PDFInfo:
     """
     Get metadata about a PDF file.
 
+    Results are cached per (path, mtime, size), so opening several dialogs
+    on the same unchanged file parses it only once. Treat the returned
+    PDFInfo as read-only.
+
     Args:
         path: Path to PDF file
 
@@ -37,9 +43,17 @@ def get_pdf_info(path: str | Path) -> PDFInfo:
     """
     path = Path(path)
 
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except OSError:
         raise FileNotFoundError(f"File not found: {path}")
 
+    return _get_pdf_info_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_pdf_info_cached(path: Path, mtime_ns: int, size: int) -> PDFInfo:
+    """Open the PDF once per file version and read its metadata."""
     try:
         doc = fitz.open(path)
         metadata = doc.metadata
@@ -47,7 +61,7 @@ def get_pdf_info(path: str | Path) -> PDFInfo:
         info = PDFInfo(
             path=path,
             page_count=len(doc),
-            file_size=path.stat().st_size,
+            file_size=size,
             title=metadata.get('title') or None,
             author=metadata.get('author') or None,
             subject=metadata.get('subject') or None,
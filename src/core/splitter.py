@@ -41,7 +41,8 @@ def split_pdf(
     input_path: str | Path,
     output_dir: str | Path,
     options: SplitOptions,
-    progress_callback: Callable[[int, str], None] | None = None
+    progress_callback: Callable[[int, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> SplitResult:
     """
     Split a PDF file according to specified options.
@@ -51,9 +52,11 @@ def split_pdf(
         output_dir: Directory for output files
         options: Split configuration
         progress_callback: Optional callback(percent, message)
+        is_cancelled: Optional callable checked before each output file;
+            when True, files written so far are deleted
 
     Returns:
-        SplitResult with list of created files
+        SplitResult with list of created files (empty if cancelled)
     """
     input_path = Path(input_path)
     output_dir = Path(output_dir)
@@ -67,32 +70,38 @@ def split_pdf(
 
     if options.mode == SplitMode.SINGLE_PAGES:
         output_files = _split_single_pages(
-            doc, output_dir, base_name, progress_callback
+            doc, output_dir, base_name, progress_callback, is_cancelled
         )
 
     elif options.mode == SplitMode.PAGE_RANGES:
         if not options.ranges:
             raise ValueError("Page ranges must be specified for RANGES mode")
         output_files = _split_by_ranges(
-            doc, output_dir, base_name, options.ranges, progress_callback
+            doc, output_dir, base_name, options.ranges, progress_callback, is_cancelled
         )
 
     elif options.mode == SplitMode.EQUAL_PARTS:
         if not options.parts or options.parts < 2:
             raise ValueError("Number of parts must be >= 2 for EQUAL_PARTS mode")
         output_files = _split_equal_parts(
-            doc, output_dir, base_name, options.parts, progress_callback
+            doc, output_dir, base_name, options.parts, progress_callback, is_cancelled
         )
 
     elif options.mode == SplitMode.EXTRACT_PAGES:
         if not options.pages:
             raise ValueError("Pages must be specified for EXTRACT mode")
         output_files = _extract_pages(
-            doc, output_dir, base_name, options.pages, progress_callback
+            doc, output_dir, base_name, options.pages, progress_callback, is_cancelled
         )
 
     doc.close()
 
+    # Don't leave a partial split behind
+    if is_cancelled and is_cancelled():
+        for output_file in output_files:
+            output_file.unlink(missing_ok=True)
+        output_files = []
+
     return SplitResult(
         output_files=output_files,
         total_pages_processed=total_pages
@@ -103,13 +112,17 @@ def _split_single_pages(
     doc: fitz.Document,
     output_dir: Path,
     base_name: str,
-    progress_callback: Callable[[int, str], None] | None
+    progress_callback: Callable[[int, str], None] | None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> list[Path]:
     """Split PDF into one file per page."""
     output_files = []
     total = len(doc)
 
     for i in range(total):
+        if is_cancelled and is_cancelled():
+            break
+
         if progress_callback:
             percent = int((i / total) * 100)
             progress_callback(percent, f"Side {i + 1} af {total}...")
@@ -134,7 +147,8 @@ def _split_by_ranges(
     output_dir: Path,
     base_name: str,
     ranges_str: str,
-    progress_callback: Callable[[int, str], None] | None
+    progress_callback: Callable[[int, str], None] | None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> list[Path]:
     """Split PDF by specified page ranges."""
     output_files = []
@@ -146,6 +160,9 @@ def _split_by_ranges(
 
     total = len(range_groups)
     for i, range_group in enumerate(range_groups):
+        if is_cancelled and is_cancelled():
+            break
+
         range_group = range_group.strip()
         if not range_group:
             continue
@@ -179,7 +196,8 @@ def _split_equal_parts(
     output_dir: Path,
     base_name: str,
     num_parts: int,
-    progress_callback: Callable[[int, str], None] | None
+    progress_callback: Callable[[int, str], None] | None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> list[Path]:
     """Split PDF into N equal parts."""
     output_files = []
@@ -189,6 +207,9 @@ def _split_equal_parts(
 
     start_page = 0
     for i in range(num_parts):
+        if is_cancelled and is_cancelled():
+            break
+
         if progress_callback:
             percent = int((i / num_parts) * 100)
             progress_callback(percent, f"Opretter del {i + 1} af {num_parts}...")
@@ -218,7 +239,8 @@ def _extract_pages(
     output_dir: Path,
     base_name: str,
     pages: list[int],
-    progress_callback: Callable[[int, str], None] | None
+    progress_callback: Callable[[int, str], None] | None,
+    is_cancelled: Callable[[], bool] | None = None
 ) -> list[Path]:
     """Extract specific pages into a single file."""
     if progress_callback:
@@ -231,6 +253,11 @@ def _extract_pages(
         if 0 <= page_num < len(doc):
             new_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
 
+    # The save is the slow part; skip it if cancelled meanwhile
+    if is_cancelled and is_cancelled():
+        new_doc.close()
+        return []
+
     new_doc.save(output_path)
     new_doc.close()
 
@@ -0,0 +1,120 @@
+"""
+On-disk cache for rendered page thumbnails.
+
+Thumbnails are stored as raw RGB files in one directory per (file,
+version, size) key, so reopening an unchanged PDF needs no rendering and
+no image decoding at all.
+"""
+
+import hashlib
+import os
+import shutil
+import struct
+from pathlib import Path
+
+from src.core.page_ops import PageThumbnail
+
+# File header: width, height, stride (little-endian uint32)
+_HEADER = struct.Struct("<III")
+
+
+class ThumbnailCache:
+    """
+    Persistent thumbnail store with a total-size budget.
+
+    Layout: {root}/{key}/{page_num:05d}.rgb. The key covers the file path,
+    modification time and size, so an edited PDF never hits stale entries.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = 200 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def key_for(self, pdf_path: str, max_size: int) -> str | None:
+        """Build the cache key for a PDF, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(pdf_path)
+        except OSError:
+            return None
+        raw = f"{os.path.abspath(pdf_path)}|{st.st_mtime_ns}|{st.st_size}|{max_size}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def load(self, key: str, page_count: int) -> list[PageThumbnail] | None:
+        """
+        Read all cached thumbnails for a key.
+
+        Returns:
+            List of PageThumbnail in page order, or None unless every page is cached
+        """
+        entry = self.root / key
+        try:
+            names = sorted(n for n in os.listdir(entry) if n.endswith(".rgb"))
+        except OSError:
+            return None
+        if len(names) != page_count:
+            return None
+
+        thumbnails = []
+        try:
+            for name in names:
+                data = (entry / name).read_bytes()
+                width, height, stride = _HEADER.unpack_from(data)
+                thumbnails.append(PageThumbnail(
+                    int(name[:-4]), width, height, stride, data[_HEADER.size:]
+                ))
+        except (OSError, ValueError, struct.error):
+            return None
+
+        try:
+            os.utime(entry)  # Mark as recently used for eviction
+        except OSError:
+            pass  # Only affects eviction order
+        return thumbnails
+
+    def load_page(self, key: str, page_num: int) -> PageThumbnail | None:
+        """Read a single cached thumbnail, or None if it isn't cached."""
+        try:
+            data = (self.root / key / f"{page_num:05d}.rgb").read_bytes()
+            width, height, stride = _HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+        return PageThumbnail(page_num, width, height, stride, data[_HEADER.size:])
+
+    def store(self, key: str, thumb: PageThumbnail) -> bool:
+        """
+        Write one thumbnail atomically (never leaves a partial file behind).
+
+        Returns:
+            True if the thumbnail is now cached; caching is best-effort
+        """
+        entry = self.root / key
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            target = entry / f"{thumb.page_num:05d}.rgb"
+            tmp = target.with_suffix(".tmp")
+            tmp.write_bytes(_HEADER.pack(thumb.width, thumb.height, thumb.stride) + thumb.samples)
+            os.replace(tmp, target)
+        except OSError:
+            return False
+        return True
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.root) as it:
+                for d in it:
+                    if not d.is_dir():
+                        continue
+                    size = sum(f.stat().st_size for f in os.scandir(d.path))
+                    entries.append((d.stat().st_mtime, size, d.path))
+                    total += size
+        except OSError:
+            return
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
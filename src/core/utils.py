@@ -2,8 +2,17 @@
 Utility functions for PDF operations.
 """
 
+import os
+import re
+from collections import defaultdict
 from pathlib import Path
 
+# One comma-separated token: a page number or a range such as "5-7"
+_PAGE_RANGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+))?\s*")
+
+# Files wanted from one directory before a single listing beats per-file stat
+_SCANDIR_MIN_FILES = 32
+
 
 def get_pdf_page_count(file_path: str | Path) -> int | None:
     """
@@ -49,6 +58,57 @@ def format_file_size(size_bytes: int) -> str:
         return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
 
 
+def get_file_sizes(file_paths: list[str]) -> dict[str, int]:
+    """
+    Get sizes for many files.
+
+    On Windows os.scandir returns file sizes with the directory listing, so
+    a large batch from one folder is sized from a single listing. Small
+    batches are stat'ed one by one instead: listing a big folder (e.g.
+    Downloads) to size a handful of files costs far more than a few stat
+    calls. Elsewhere DirEntry.stat() is a stat per entry anyway, so files
+    are always stat'ed directly.
+
+    Args:
+        file_paths: File paths to look up
+
+    Returns:
+        Dict mapping each found path to its size in bytes (missing files omitted)
+    """
+    by_dir: dict[str, dict[str, str]] = defaultdict(dict)
+    for file_path in file_paths:
+        by_dir[os.path.dirname(file_path)][os.path.basename(file_path)] = file_path
+
+    sizes = {}
+    for dir_path, wanted in by_dir.items():
+        if os.name == "nt" and len(wanted) >= _SCANDIR_MIN_FILES:
+            _scan_file_sizes(dir_path, wanted, sizes)
+            continue
+        for file_path in wanted.values():
+            try:
+                sizes[file_path] = os.stat(file_path).st_size
+            except OSError:
+                continue
+
+    return sizes
+
+
+def _scan_file_sizes(dir_path: str, wanted: dict[str, str], sizes: dict[str, int]):
+    """Size wanted files from one directory listing, stopping once all are found."""
+    remaining = len(wanted)
+    try:
+        with os.scandir(dir_path or ".") as entries:
+            for entry in entries:
+                file_path = wanted.get(entry.name)
+                if file_path is not None:
+                    sizes[file_path] = entry.stat().st_size
+                    remaining -= 1
+                    if not remaining:
+                        break
+    except OSError:
+        pass
+
+
 def get_output_path(
     input_path: Path,
     suffix: str = "_output",
@@ -114,28 +174,14 @@ def parse_page_ranges(ranges_str: str, total_pages: int) -> list[int]:
     pages = set()
 
     for part in ranges_str.split(','):
-        part = part.strip()
-        if not part:
+        # Whole-token match: malformed parts ("1.5", "3a", "-3") are skipped
+        match = _PAGE_RANGE_RE.fullmatch(part)
+        if match is None:
             continue
-
-        if '-' in part:
-            try:
-                start, end = part.split('-', 1)
-                start = int(start.strip())
-                end = int(end.strip())
-                # Convert to 0-indexed and clamp to valid range
-                start = max(0, start - 1)
-                end = min(total_pages - 1, end - 1)
-                pages.update(range(start, end + 1))
-            except ValueError:
-                continue
-        else:
-            try:
-                page = int(part) - 1  # Convert to 0-indexed
-                if 0 <= page < total_pages:
-                    pages.add(page)
-            except ValueError:
-                continue
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else start
+        # Convert to 0-indexed and clamp to valid range
+        pages.update(range(max(0, start - 1), min(total_pages, end)))
 
     return sorted(pages)
 
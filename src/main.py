@@ -8,19 +8,22 @@ Usage:
     python src/main.py
 """
 
+import multiprocessing
 import sys
 
 from PyQt6.QtWidgets import QApplication
 
 from src.ui.main_window import MainWindow
-from src.ui.styles import get_stylesheet
+from src.ui.styles import STYLESHEET
 
 
 def main():
     """Application entry point."""
+    multiprocessing.freeze_support()  # Worker processes in frozen builds
+
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Consistent cross-platform look
-    app.setStyleSheet(get_stylesheet())
+    app.setStyleSheet(STYLESHEET)
 
     window = MainWindow()
     window.show()
@@ -1,18 +1,31 @@
 """PDF Toolkit dialog windows."""
 
-from .merge_dialog import MergeDialog
-from .split_dialog import SplitDialog
-from .convert_dialog import ConvertDialog
-from .settings_dialog import SettingsDialog
-from .ocr_dialog import OCRDialog
-from .compress_dialog import CompressDialog
-from .rotate_dialog import RotateDialog
-from .remove_dialog import RemoveDialog
-from .encrypt_dialog import EncryptDialog
-from .citation_dialog import CitationDialog
+import importlib
+
+# Dialogs are imported on first attribute access, so importing one dialog
+# module doesn't load every other dialog (and its core dependencies)
+_DIALOG_MODULES = {
+    'MergeDialog': 'merge_dialog',
+    'SplitDialog': 'split_dialog',
+    'ConvertDialog': 'convert_dialog',
+    'SettingsDialog': 'settings_dialog',
+    'OCRDialog': 'ocr_dialog',
+    'CompressDialog': 'compress_dialog',
+    'RotateDialog': 'rotate_dialog',
+    'RemoveDialog': 'remove_dialog',
+    'EncryptDialog': 'encrypt_dialog',
+    'CitationDialog': 'citation_dialog',
+}
 
 __all__ = [
     'MergeDialog', 'SplitDialog', 'ConvertDialog', 'SettingsDialog',
     'OCRDialog', 'CompressDialog', 'RotateDialog', 'RemoveDialog', 'EncryptDialog',
     'CitationDialog'
 ]
+
+
+def __getattr__(name: str):
+    module = _DIALOG_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
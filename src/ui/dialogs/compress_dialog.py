@@ -3,18 +3,44 @@ Compression dialog for reducing PDF file size.
 """
 
 import os
+import threading
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFileDialog, QGroupBox,
-    QRadioButton, QProgressBar, QMessageBox, QFrame
+    QRadioButton, QProgressBar, QMessageBox, QFrame,
+    QComboBox, QWidget, QButtonGroup
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
+from src.ui.widgets.progress import ProgressThrottle
 from src.core.compressor import (
     compress_pdf, get_pdf_size_info,
-    CompressionLevel, CompressionResult
+    CompressionLevel, CompressionResult, DEFAULT_DEFLATE_LEVELS
+)
+
+
+# Widget stylesheets - defined once at import instead of per dialog
+_FILE_LABEL_QSS = "color: #D4A84B; font-size: 14px; font-weight: bold;"
+_INFO_FRAME_QSS = """
+    QFrame {
+        background-color: #1A3333;
+        border: 1px solid #2D5A5A;
+        border-radius: 6px;
+        padding: 10px;
+    }
+"""
+_SIZE_LABEL_QSS = "color: #E8E4D9;"
+_DETAILS_LABEL_QSS = "color: #7FBFB5; font-size: 12px;"
+_MINT_LABEL_QSS = "color: #7FBFB5;"
+_RESULT_LABEL_QSS = "color: #22c55e; font-weight: bold;"
+
+# Compression presets indexed by their radio button id in the button group
+_PRESETS = (
+    CompressionLevel.HIGH_QUALITY,
+    CompressionLevel.BALANCED,
+    CompressionLevel.MAXIMUM,
 )
 
 
@@ -24,13 +50,17 @@ class CompressWorker(QThread):
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(object)  # CompressionResult
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()  # Emitted instead of finished/error after cancel()
 
-    def __init__(self, input_path: str, output_path: str, level: CompressionLevel):
+    def __init__(self, input_path: str, output_path: str,
+                 level: CompressionLevel, deflate_level: int):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
         self.level = level
-        self._cancelled = False
+        self.deflate_level = deflate_level
+        self._cancel_event = threading.Event()
+        self._throttle = ProgressThrottle()
 
     def run(self):
         """Execute compression in background thread."""
@@ -39,24 +69,43 @@ class CompressWorker(QThread):
                 self.input_path,
                 self.output_path,
                 self.level,
-                self._on_progress
+                self._on_progress,
+                deflate_level=self.deflate_level,
+                is_cancelled=self._cancel_event.is_set
             )
 
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.finished.emit(result)
 
         except Exception as e:
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.error.emit(str(e))
 
+        if self._cancel_event.is_set():
+            self.cancelled.emit()
+
     def _on_progress(self, percent: int, message: str):
-        """Progress callback."""
-        if not self._cancelled:
+        """Progress callback, throttled to limit GUI thread wake-ups."""
+        if not self._cancel_event.is_set() and self._throttle.should_emit(percent, message):
             self.progress.emit(percent, message)
 
     def cancel(self):
-        """Cancel the operation."""
-        self._cancelled = True
+        """Cancel the operation; compress_pdf stops at the next page."""
+        self._cancel_event.set()
+
+
+class FileInfoWorker(QThread):
+    """Background worker for reading PDF size information."""
+
+    finished = pyqtSignal(dict)
+
+    def __init__(self, pdf_path: str):
+        super().__init__()
+        self.pdf_path = pdf_path
+
+    def run(self):
+        """Read file info in background thread."""
+        self.finished.emit(get_pdf_size_info(self.pdf_path))
 
 
 class CompressDialog(QDialog):
@@ -65,7 +114,10 @@ class CompressDialog(QDialog):
     def __init__(self, files: list[str], parent=None):
         super().__init__(parent)
         self.files = files
+        self._input_path = Path(files[0])
         self.worker = None
+        self.info_worker = None
+        self._dir_dialog: QFileDialog | None = None
         self._setup_ui()
         self._load_file_info()
 
@@ -79,33 +131,32 @@ class CompressDialog(QDialog):
         layout.setSpacing(15)
 
         # File info
-        file_name = Path(self.files[0]).name
+        file_name = self._input_path.name
         file_label = QLabel(f"Fil: {file_name}")
-        file_label.setStyleSheet("color: #D4A84B; font-size: 14px; font-weight: bold;")
+        file_label.setStyleSheet(_FILE_LABEL_QSS)
         layout.addWidget(file_label)
 
         # File size info frame
         self.info_frame = QFrame()
-        self.info_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1A3333;
-                border: 1px solid #2D5A5A;
-                border-radius: 6px;
-                padding: 10px;
-            }
-        """)
+        self.info_frame.setStyleSheet(_INFO_FRAME_QSS)
         info_layout = QVBoxLayout(self.info_frame)
 
         self.size_label = QLabel("Indlæser fil info...")
-        self.size_label.setStyleSheet("color: #E8E4D9;")
+        self.size_label.setStyleSheet(_SIZE_LABEL_QSS)
         info_layout.addWidget(self.size_label)
 
         self.details_label = QLabel("")
-        self.details_label.setStyleSheet("color: #7FBFB5; font-size: 12px;")
+        self.details_label.setStyleSheet(_DETAILS_LABEL_QSS)
         info_layout.addWidget(self.details_label)
 
         layout.addWidget(self.info_frame)
 
+        # Options container - enabled/disabled as one unit while compressing
+        self._controls_container = QWidget()
+        controls_layout = QVBoxLayout(self._controls_container)
+        controls_layout.setContentsMargins(0, 0, 0, 0)
+        controls_layout.setSpacing(15)
+
         # Compression level
         level_group = QGroupBox("Komprimeringsniveau")
         level_layout = QVBoxLayout(level_group)
@@ -123,7 +174,28 @@ class CompressDialog(QDialog):
         self.radio_max.setToolTip("~70-90% reduktion. Kan påvirke billedkvalitet.")
         level_layout.addWidget(self.radio_max)
 
-        layout.addWidget(level_group)
+        self._level_buttons = QButtonGroup(self)
+        for button_id, radio in enumerate((self.radio_high, self.radio_balanced, self.radio_max)):
+            self._level_buttons.addButton(radio, button_id)
+
+        # Deflate level for PDF streams - follows the selected preset
+        deflate_layout = QHBoxLayout()
+        deflate_layout.addWidget(QLabel("Deflate-niveau:"))
+        self.combo_deflate = QComboBox()
+        self.combo_deflate.addItem("1 (hurtigst)", 1)
+        self.combo_deflate.addItem("6 (standard)", 6)
+        self.combo_deflate.addItem("9 (mindst fil, langsom)", 9)
+        self.combo_deflate.setToolTip(
+            "zlib-niveau for PDF-strømme. Over 6 giver meget lidt ekstra reduktion."
+        )
+        deflate_layout.addWidget(self.combo_deflate)
+        deflate_layout.addStretch()
+        level_layout.addLayout(deflate_layout)
+
+        self._level_buttons.idToggled.connect(self._on_level_changed)
+        self._on_level_changed(self._level_buttons.checkedId(), True)
+
+        controls_layout.addWidget(level_group)
 
         # Output location
         output_group = QGroupBox("Output")
@@ -131,8 +203,8 @@ class CompressDialog(QDialog):
 
         dir_layout = QHBoxLayout()
         dir_layout.addWidget(QLabel("Gem i:"))
-        self.label_output_dir = QLabel(str(Path(self.files[0]).parent))
-        self.label_output_dir.setStyleSheet("color: #7FBFB5;")
+        self.label_output_dir = QLabel(str(self._input_path.parent))
+        self.label_output_dir.setStyleSheet(_MINT_LABEL_QSS)
         self.label_output_dir.setWordWrap(True)
         dir_layout.addWidget(self.label_output_dir, 1)
         self.btn_browse = QPushButton("Vælg...")
@@ -140,7 +212,9 @@ class CompressDialog(QDialog):
         dir_layout.addWidget(self.btn_browse)
         output_layout.addLayout(dir_layout)
 
-        layout.addWidget(output_group)
+        controls_layout.addWidget(output_group)
+
+        layout.addWidget(self._controls_container)
 
         # Progress
         self.progress_bar = QProgressBar()
@@ -149,13 +223,13 @@ class CompressDialog(QDialog):
 
         self.progress_label = QLabel("")
         self.progress_label.setVisible(False)
-        self.progress_label.setStyleSheet("color: #7FBFB5;")
+        self.progress_label.setStyleSheet(_MINT_LABEL_QSS)
         layout.addWidget(self.progress_label)
 
         # Result info (shown after compression)
         self.result_label = QLabel("")
         self.result_label.setVisible(False)
-        self.result_label.setStyleSheet("color: #22c55e; font-weight: bold;")
+        self.result_label.setStyleSheet(_RESULT_LABEL_QSS)
         layout.addWidget(self.result_label)
 
         # Spacer
@@ -177,8 +251,22 @@ class CompressDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def _load_file_info(self):
-        """Load and display file information."""
-        info = get_pdf_size_info(self.files[0])
+        """Load file information in the background."""
+        # Don't allow compression until we know the input is readable
+        self.btn_start.setEnabled(False)
+
+        self.info_worker = FileInfoWorker(self.files[0])
+        self.info_worker.finished.connect(self._on_file_info)
+        self.info_worker.start()
+
+    def _on_file_info(self, info: dict):
+        """Display loaded file information."""
+        self.info_worker = None
+
+        if "error" in info:
+            self.size_label.setText("Kunne ikke læse fil info")
+            self.details_label.setText(info["error"])
+            return
 
         size_mb = info["file_size"] / (1024 * 1024)
         self.size_label.setText(f"Størrelse: {size_mb:.2f} MB")
@@ -187,36 +275,56 @@ class CompressDialog(QDialog):
         if info["has_embedded_fonts"]:
             details += " · Indlejrede skrifttyper"
         self.details_label.setText(details)
+        self.btn_start.setEnabled(True)
 
-    def _get_compression_level(self) -> CompressionLevel:
-        """Get selected compression level."""
-        if self.radio_high.isChecked():
-            return CompressionLevel.HIGH_QUALITY
-        elif self.radio_max.isChecked():
-            return CompressionLevel.MAXIMUM
-        else:
-            return CompressionLevel.BALANCED
+    def _get_preset(self) -> CompressionLevel:
+        """Get selected compression preset."""
+        return _PRESETS[self._level_buttons.checkedId()]
+
+    def _on_level_changed(self, button_id: int, checked: bool):
+        """Select the default deflate level for the chosen preset."""
+        if not checked:
+            return
+        deflate_level = DEFAULT_DEFLATE_LEVELS[_PRESETS[button_id]]
+        self.combo_deflate.setCurrentIndex(self.combo_deflate.findData(deflate_level))
+
+    def _get_compression_level(self) -> tuple[CompressionLevel, int]:
+        """Get selected compression level and deflate level."""
+        return self._get_preset(), self.combo_deflate.currentData()
 
     def _browse_output(self):
         """Browse for output directory."""
-        current = self.label_output_dir.text()
-        path = QFileDialog.getExistingDirectory(self, "Vælg output mappe", current)
-        if path:
-            self.label_output_dir.setText(path)
+        # Reuse one dialog instance across browses
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self, "Vælg output mappe")
+            self._dir_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            self._dir_dialog.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+
+        self._dir_dialog.setDirectory(self.label_output_dir.text())
+        if self._dir_dialog.exec():
+            self.label_output_dir.setText(self._dir_dialog.selectedFiles()[0])
 
     def _start_compression(self):
         """Start PDF compression."""
         input_path = self.files[0]
-        output_dir = Path(self.label_output_dir.text())
-        input_name = Path(input_path).stem
-        output_path = str(output_dir / f"{input_name}_compressed.pdf")
+        output_path = os.path.join(
+            self.label_output_dir.text(),
+            f"{self._input_path.stem}_compressed.pdf"
+        )
 
-        # Check if output exists
-        if os.path.exists(output_path):
+        # Check if output exists (single stat, no Path allocation)
+        try:
+            os.stat(output_path)
+            exists = True
+        except OSError:
+            exists = False  # Like os.path.exists; the save reports real errors
+
+        if exists:
             reply = QMessageBox.question(
                 self,
                 "Fil eksisterer",
-                f"Filen '{Path(output_path).name}' eksisterer allerede.\n"
+                f"Filen '{os.path.basename(output_path)}' eksisterer allerede.\n"
                 "Vil du overskrive den?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
@@ -225,10 +333,7 @@ class CompressDialog(QDialog):
 
         # Disable UI
         self.btn_start.setEnabled(False)
-        self.radio_high.setEnabled(False)
-        self.radio_balanced.setEnabled(False)
-        self.radio_max.setEnabled(False)
-        self.btn_browse.setEnabled(False)
+        self._controls_container.setEnabled(False)
 
         # Show progress
         self.progress_bar.setVisible(True)
@@ -238,11 +343,12 @@ class CompressDialog(QDialog):
         self.result_label.setVisible(False)
 
         # Start worker
-        level = self._get_compression_level()
-        self.worker = CompressWorker(input_path, output_path, level)
+        level, deflate_level = self._get_compression_level()
+        self.worker = CompressWorker(input_path, output_path, level, deflate_level)
         self.worker.progress.connect(self._on_progress)
         self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
+        self.worker.cancelled.connect(self._on_worker_cancelled)
         self.worker.start()
 
     def _on_progress(self, percent: int, message: str):
@@ -293,25 +399,41 @@ class CompressDialog(QDialog):
     def _reset_ui(self):
         """Reset UI after processing."""
         self.btn_start.setEnabled(True)
-        self.radio_high.setEnabled(True)
-        self.radio_balanced.setEnabled(True)
-        self.radio_max.setEnabled(True)
-        self.btn_browse.setEnabled(True)
+        self._controls_container.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
 
+    def _stop_info_worker(self):
+        """Wait for a pending file info load so its thread isn't destroyed mid-run."""
+        if self.info_worker and self.info_worker.isRunning():
+            self.info_worker.finished.disconnect(self._on_file_info)
+            self.info_worker.wait()
+        self.info_worker = None
+
     def _on_cancel(self):
         """Handle cancel button."""
-        if self.worker and self.worker.isRunning():
-            self.worker.cancel()
-            self.worker.wait(1000)
-            self.worker = None
-
         self.reject()
 
-    def closeEvent(self, event):
-        """Handle dialog close."""
+    def reject(self):
+        """
+        Close the dialog (cancel button, Esc or window X).
+
+        compress_pdf only checks for cancellation between pages, not during
+        the final save, so a running worker is signalled and the dialog
+        closes once it reports back instead of blocking the event loop.
+        """
+        self._stop_info_worker()
         if self.worker and self.worker.isRunning():
             self.worker.cancel()
-            self.worker.wait(1000)
-        event.accept()
+            self.btn_start.setEnabled(False)
+            self.btn_cancel.setEnabled(False)
+            self._controls_container.setEnabled(False)
+            self.progress_label.setText("Annullerer...")
+            return
+        super().reject()
+
+    def _on_worker_cancelled(self):
+        """Finish closing once a cancelled worker has stopped."""
+        self.worker.wait()  # run() returns right after emitting
+        self.worker = None
+        self.reject()
@@ -2,18 +2,29 @@
 Dialog for converting DOCX files to PDF.
 """
 
+import threading
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QListWidget, QListWidgetItem, QPushButton,
-    QFileDialog, QMessageBox, QGroupBox
+    QFileDialog, QMessageBox, QGroupBox, QWidget
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
-from src.ui.widgets.progress import ProgressWidget
+from src.ui.widgets.progress import ProgressWidget, ProgressThrottle
 from src.core.converter import convert_multiple_docx, ConvertResult
-from src.core.utils import format_file_size
+from src.core.utils import format_file_size, get_file_sizes
+from src.config.constants import DOCX_EXTENSIONS
+
+
+# Widget stylesheets - defined once at import instead of per dialog
+_INFO_LABEL_QSS = "color: #7FBFB5; font-style: italic;"
+_OUTPUT_DEFAULT_QSS = "color: #7FBFB5;"
+_OUTPUT_SELECTED_QSS = "color: #E8E4D9;"
+
+# Max files listed per section in the result message box
+_MAX_LISTED_RESULTS = 20
 
 
 class ConvertWorker(QThread):
@@ -27,7 +38,8 @@ class ConvertWorker(QThread):
         super().__init__()
         self.files = files
         self.output_dir = output_dir
-        self._cancelled = False
+        self._cancel_event = threading.Event()
+        self._throttle = ProgressThrottle()
 
     def run(self):
         """Execute conversion in background thread."""
@@ -35,33 +47,40 @@ class ConvertWorker(QThread):
             results = convert_multiple_docx(
                 self.files,
                 self.output_dir,
-                progress_callback=self._on_progress
+                progress_callback=self._on_progress,
+                is_cancelled=self._cancel_event.is_set
             )
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.finished.emit(results)
         except Exception as e:
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        """Forward progress to signal."""
-        if not self._cancelled:
+        """Forward progress to signal, throttled to limit GUI thread wake-ups."""
+        if not self._cancel_event.is_set() and self._throttle.should_emit(percent, message):
             self.progress.emit(percent, message)
 
     def cancel(self):
-        """Request cancellation."""
-        self._cancelled = True
+        """Request cancellation; conversion stops before the next file."""
+        self._cancel_event.set()
 
 
 class ConvertDialog(QDialog):
     """Dialog for converting DOCX files to PDF."""
 
-    def __init__(self, files: list[str], parent=None):
+    def __init__(self, files: list[str], parent=None,
+                 progress_widget: ProgressWidget | None = None):
         super().__init__(parent)
+        # Shared progress widget lent by the main window (None = own widget)
+        self._shared_progress = progress_widget
         # Filter to only DOCX files
-        self.files = [f for f in files if f.lower().endswith(('.docx', '.doc'))]
+        self.files = [f for f in files if f.lower().endswith(DOCX_EXTENSIONS)]
+        self._file_set = set(self.files)  # O(1) duplicate checks in _add_files
         self.output_dir: str | None = None
         self.worker: ConvertWorker | None = None
+        self._open_dialog: QFileDialog | None = None
+        self._dir_dialog: QFileDialog | None = None
 
         self._setup_ui()
         self._populate_file_list()
@@ -76,10 +95,15 @@ class ConvertDialog(QDialog):
 
         # Info label
         info_label = QLabel("Konverterer Word-dokumenter til PDF ved hjælp af Microsoft Word.")
-        info_label.setStyleSheet("color: #7FBFB5; font-style: italic;")
+        info_label.setStyleSheet(_INFO_LABEL_QSS)
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
 
+        # Input/output container - enabled/disabled as one unit while converting
+        self._controls_container = QWidget()
+        controls_layout = QVBoxLayout(self._controls_container)
+        controls_layout.setContentsMargins(0, 0, 0, 0)
+
         # File list group
         files_group = QGroupBox("FILER AT KONVERTERE")
         files_layout = QVBoxLayout(files_group)
@@ -103,14 +127,14 @@ class ConvertDialog(QDialog):
         btn_layout.addStretch()
         files_layout.addLayout(btn_layout)
 
-        layout.addWidget(files_group)
+        controls_layout.addWidget(files_group)
 
         # Output group
         output_group = QGroupBox("OUTPUT MAPPE")
         output_layout = QHBoxLayout(output_group)
 
         self.output_label = QLabel("Samme mappe som original")
-        self.output_label.setStyleSheet("color: #7FBFB5;")
+        self.output_label.setStyleSheet(_OUTPUT_DEFAULT_QSS)
         output_layout.addWidget(self.output_label, 1)
 
         self.btn_browse = QPushButton("Vælg...")
@@ -118,12 +142,20 @@ class ConvertDialog(QDialog):
         self.btn_browse.clicked.connect(self._browse_output)
         output_layout.addWidget(self.btn_browse)
 
-        layout.addWidget(output_group)
+        controls_layout.addWidget(output_group)
+
+        layout.addWidget(self._controls_container)
 
-        # Progress
-        self.progress = ProgressWidget()
+        # Progress - reuse the shared widget when one is provided
+        if self._shared_progress is not None:
+            self.progress = self._shared_progress
+            self.progress.reset()
+            self.progress.clear_error()
+        else:
+            self.progress = ProgressWidget()
         self.progress.cancelled.connect(self._cancel)
         layout.addWidget(self.progress)
+        self.progress.show()  # Reparented widgets start out hidden
 
         # Action buttons
         btn_layout = QHBoxLayout()
@@ -143,17 +175,26 @@ class ConvertDialog(QDialog):
 
     def _populate_file_list(self):
         """Fill the file list with initial files."""
-        for file_path in self.files:
-            self._add_file_item(file_path)
+        sizes = get_file_sizes(self.files)
+
+        # Suspend repaints so N inserts cost a single relayout
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            for file_path in self.files:
+                self._add_file_item(file_path, sizes.get(file_path))
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+            self.file_list.viewport().update()
 
         self._update_convert_button()
 
-    def _add_file_item(self, file_path: str):
-        """Add a file to the list widget."""
+    def _add_file_item(self, file_path: str, size_bytes: int | None = None):
+        """Add a file to the list widget, using a prefetched size if given."""
         path = Path(file_path)
         try:
-            size = format_file_size(path.stat().st_size)
-            text = f"{path.name}  ({size})"
+            if size_bytes is None:
+                size_bytes = path.stat().st_size
+            text = f"{path.name}  ({format_file_size(size_bytes)})"
         except OSError:
             text = path.name
 
@@ -163,16 +204,25 @@ class ConvertDialog(QDialog):
 
     def _add_files(self):
         """Open file dialog to add more files."""
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Vælg Word-filer",
-            "",
-            "Word dokumenter (*.docx *.doc)"
-        )
-        for f in files:
-            if f not in self.files:
-                self.files.append(f)
-                self._add_file_item(f)
+        # Reuse one dialog instance across calls
+        if self._open_dialog is None:
+            self._open_dialog = QFileDialog(self, "Vælg Word-filer")
+            self._open_dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+            self._open_dialog.setNameFilter("Word dokumenter (*.docx *.doc)")
+
+        files = self._open_dialog.selectedFiles() if self._open_dialog.exec() else []
+        sizes = get_file_sizes(files)
+
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            for f in files:
+                if f not in self._file_set:
+                    self.files.append(f)
+                    self._file_set.add(f)
+                    self._add_file_item(f, sizes.get(f))
+        finally:
+            self.file_list.setUpdatesEnabled(True)
+            self.file_list.viewport().update()
 
         self._update_convert_button()
 
@@ -183,6 +233,7 @@ class ConvertDialog(QDialog):
             item = self.file_list.takeItem(row)
             file_path = item.data(Qt.ItemDataRole.UserRole)
             self.files.remove(file_path)
+            self._file_set.discard(file_path)
 
         self._update_convert_button()
 
@@ -192,14 +243,20 @@ class ConvertDialog(QDialog):
 
     def _browse_output(self):
         """Open directory dialog for output."""
-        path = QFileDialog.getExistingDirectory(
-            self,
-            "Vælg output mappe"
-        )
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self, "Vælg output mappe")
+            self._dir_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._dir_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            self._dir_dialog.setOption(QFileDialog.Option.DontResolveSymlinks, True)
+
+        if not self._dir_dialog.exec():
+            return
+
+        path = self._dir_dialog.selectedFiles()[0]
         if path:
             self.output_dir = path
             self.output_label.setText(path)
-            self.output_label.setStyleSheet("color: #E8E4D9;")
+            self.output_label.setStyleSheet(_OUTPUT_SELECTED_QSS)
 
     def _start_convert(self):
         """Begin conversion operation."""
@@ -213,8 +270,7 @@ class ConvertDialog(QDialog):
 
         # Disable UI during operation
         self.btn_convert.setEnabled(False)
-        self.btn_browse.setEnabled(False)
-        self.btn_add.setEnabled(False)
+        self._controls_container.setEnabled(False)
         self.progress.start("Starter konvertering...")
 
         # Create and start worker
@@ -226,28 +282,42 @@ class ConvertDialog(QDialog):
 
     def _on_finished(self, results: list[ConvertResult]):
         """Handle successful conversion."""
-        success_count = sum(1 for r in results if r.success)
+        # Partition once; everything below works on the two lists
+        succeeded: list[ConvertResult] = []
+        failed: list[ConvertResult] = []
+        for r in results:
+            (succeeded if r.success else failed).append(r)
+        success_count = len(succeeded)
         total = len(results)
 
         self.progress.finish(f"Færdig! {success_count}/{total} konverteret")
 
         # Build result message
-        message = f"Konvertering fuldført!\n\n"
-        message += f"Succesfulde: {success_count}\n"
-        message += f"Fejlede: {total - success_count}\n\n"
+        parts = [
+            "Konvertering fuldført!\n\n",
+            f"Succesfulde: {success_count}\n",
+            f"Fejlede: {total - success_count}\n\n",
+        ]
 
         if success_count > 0:
-            message += "Oprettede filer:\n"
-            for r in results:
-                if r.success:
-                    message += f"  • {r.output_path.name}\n"
-
-        if any(not r.success for r in results):
-            message += "\nFejl:\n"
-            for r in results:
-                if not r.success:
-                    message += f"  • {r.input_path.name}: {r.error_message}\n"
+            parts.append("Oprettede filer:\n")
+            parts.extend(
+                f"  • {r.output_path.name}\n"
+                for r in succeeded[:_MAX_LISTED_RESULTS]
+            )
+            if success_count > _MAX_LISTED_RESULTS:
+                parts.append(f"  ... og {success_count - _MAX_LISTED_RESULTS} flere\n")
+
+        if success_count < total:
+            parts.append("\nFejl:\n")
+            parts.extend(
+                f"  • {r.input_path.name}: {r.error_message}\n"
+                for r in failed[:_MAX_LISTED_RESULTS]
+            )
+            if len(failed) > _MAX_LISTED_RESULTS:
+                parts.append(f"  ... og {len(failed) - _MAX_LISTED_RESULTS} flere\n")
 
+        message = "".join(parts)
         QMessageBox.information(self, "Konvertering fuldført", message)
         self.accept()
 
@@ -265,8 +335,14 @@ class ConvertDialog(QDialog):
     def _reset_ui(self):
         """Reset UI after operation."""
         self.btn_convert.setEnabled(True)
-        self.btn_browse.setEnabled(True)
-        self.btn_add.setEnabled(True)
+        self._controls_container.setEnabled(True)
+
+    def done(self, result: int):
+        """Detach the shared progress widget so it outlives this dialog."""
+        if self._shared_progress is not None:
+            self.progress.cancelled.disconnect(self._cancel)
+            self.progress.setParent(None)
+        super().done(result)
 
     def _cancel(self):
         """Cancel ongoing operation."""
@@ -2,20 +2,29 @@
 Encryption/Password protection dialog.
 """
 
+import operator
 import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import reduce
 from pathlib import Path
+from typing import Callable
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QMessageBox, QGroupBox,
     QLineEdit, QProgressBar, QCheckBox, QTabWidget,
-    QWidget
+    QWidget, QComboBox
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
+from src.ui.widgets.progress import ProgressThrottle
+from src.ui.workers import process_pool
+from src.core.utils import get_file_sizes
 from src.core.encryption import (
-    encrypt_pdf, decrypt_pdf, is_pdf_encrypted,
-    EncryptionResult, PERM_PRINT, PERM_MODIFY, PERM_COPY, PERM_ANNOTATE
+    encrypt_pdf, decrypt_pdf, copy_pdf, is_pdf_encrypted,
+    EncryptionResult, PERM_PRINT, PERM_MODIFY, PERM_COPY, PERM_ANNOTATE,
+    ENCRYPT_AES_128, ENCRYPT_AES_256
 )
 
 
@@ -27,13 +36,17 @@ class EncryptWorker(QThread):
     error = pyqtSignal(str)
 
     def __init__(self, input_path: str, output_path: str,
-                 user_pw: str, owner_pw: str, permissions: int):
+                 user_pw: str, owner_pw: str, permissions: int,
+                 algorithm: int = ENCRYPT_AES_256):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
         self.user_pw = user_pw
         self.owner_pw = owner_pw
         self.permissions = permissions
+        self.algorithm = algorithm
+        self._cancel_event = threading.Event()
+        self._throttle = ProgressThrottle()
 
     def run(self):
         try:
@@ -43,43 +56,148 @@ class EncryptWorker(QThread):
                 self.user_pw,
                 self.owner_pw,
                 self.permissions,
-                self._on_progress
+                self._on_progress,
+                algorithm=self.algorithm
             )
-            self.finished.emit(result)
+            if not self._cancel_event.is_set():
+                self.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            if not self._cancel_event.is_set():
+                self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        self.progress.emit(percent, message)
+        if not self._cancel_event.is_set() and self._throttle.should_emit(percent, message):
+            self.progress.emit(percent, message)
+
+    def cancel(self):
+        """Drop the result; a single file runs to completion."""
+        self._cancel_event.set()
 
 
 class DecryptWorker(QThread):
-    """Background worker for decryption."""
+    """
+    Background worker for decryption.
+
+    With copy_only (input known to be unencrypted) the file is copied
+    as-is instead of being decrypted.
+    """
 
     progress = pyqtSignal(int, str)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
-    def __init__(self, input_path: str, output_path: str, password: str):
+    def __init__(self, input_path: str, output_path: str, password: str,
+                 copy_only: bool = False):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
         self.password = password
+        self.copy_only = copy_only
+        self._cancel_event = threading.Event()
+        self._throttle = ProgressThrottle()
 
     def run(self):
         try:
-            result = decrypt_pdf(
-                self.input_path,
-                self.output_path,
-                self.password,
-                self._on_progress
-            )
-            self.finished.emit(result)
+            if self.copy_only:
+                result = copy_pdf(self.input_path, self.output_path)
+            else:
+                result = decrypt_pdf(
+                    self.input_path,
+                    self.output_path,
+                    self.password,
+                    self._on_progress
+                )
+            if not self._cancel_event.is_set():
+                self.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            if not self._cancel_event.is_set():
+                self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        self.progress.emit(percent, message)
+        if not self._cancel_event.is_set() and self._throttle.should_emit(percent, message):
+            self.progress.emit(percent, message)
+
+    def cancel(self):
+        """Drop the result; a single file runs to completion."""
+        self._cancel_event.set()
+
+
+class BatchEncryptWorker(QThread):
+    """Background worker that encrypts/decrypts several files in parallel.
+
+    Files are independent, so each one runs as its own task in a process
+    pool. PyMuPDF holds the GIL (and is not thread-safe), so threads would
+    serialize; separate processes use all cores. Only this QThread emits
+    signals; pool tasks just return results.
+    """
+
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(list)  # List of EncryptionResult, in input order
+    error = pyqtSignal(str)
+
+    # How often the batch checks for cancellation while jobs run (seconds)
+    _CANCEL_POLL_INTERVAL = 0.2
+
+    def __init__(self, jobs: list[tuple[str, str]],
+                 operation: Callable[..., EncryptionResult], **options):
+        super().__init__()
+        self.jobs = jobs  # (input_path, output_path) pairs
+        self.operation = operation  # Module-level function, must be picklable
+        self.options = options
+        self._cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            total = len(self.jobs)
+            results: list[EncryptionResult | None] = [None] * total
+            max_workers = min(total, os.cpu_count() or 1)
+
+            # No context manager: its exit would wait for the running jobs on cancel
+            pool = process_pool(max_workers)
+            try:
+                futures = {
+                    pool.submit(self.operation, input_path, output_path, **self.options): i
+                    for i, (input_path, output_path) in enumerate(self.jobs)
+                }
+                pending = set(futures)
+                done = 0
+                while pending and not self._cancel_event.is_set():
+                    completed, pending = wait(
+                        pending, timeout=self._CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                    )
+                    for future in completed:
+                        index = futures[future]
+                        results[index] = future.result()
+                        done += 1
+                        name = Path(self.jobs[index][0]).name
+                        self.progress.emit(int(done * 100 / total), f"{name} ({done}/{total})")
+            finally:
+                pool.shutdown(wait=not self._cancel_event.is_set(), cancel_futures=True)
+
+            if not self._cancel_event.is_set():
+                self.finished.emit(results)
+        except Exception as e:
+            if not self._cancel_event.is_set():
+                self.error.emit(str(e))
+
+    def cancel(self):
+        """Cancel the batch; files not yet started are skipped."""
+        self._cancel_event.set()
+
+
+class OutputCheckWorker(QThread):
+    """Background worker that finds which candidate output files already exist."""
+
+    finished = pyqtSignal(set)
+
+    def __init__(self, paths: list[str]):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        """Scan output directories in background thread."""
+        # Sizes are only present for files that exist
+        self.finished.emit(set(get_file_sizes(self.paths)))
 
 
 class EncryptDialog(QDialog):
@@ -88,9 +206,19 @@ class EncryptDialog(QDialog):
     def __init__(self, files: list[str], parent=None):
         super().__init__(parent)
         self.files = files
+        self._input_path = Path(files[0])
         self.worker = None
+        self._enc_status: tuple[bool, bool] = (False, False)  # (is_encrypted, needs_pw)
+
+        # Output names are fixed per input, so existence is checked up front
+        self._encrypt_jobs = self._build_jobs("_encrypted")
+        self._decrypt_jobs = self._build_jobs("_decrypted")
+        self._existing_outputs: set[str] | None = None  # None until checked
+        self.output_check_worker = None
+
         self._setup_ui()
         self._check_encryption_status()
+        self._check_existing_outputs()
 
     def _setup_ui(self):
         """Initialize dialog UI."""
@@ -102,8 +230,10 @@ class EncryptDialog(QDialog):
         layout.setSpacing(15)
 
         # File info
-        file_name = Path(self.files[0]).name
-        file_label = QLabel(f"Fil: {file_name}")
+        if len(self.files) == 1:
+            file_label = QLabel(f"Fil: {self._input_path.name}")
+        else:
+            file_label = QLabel(f"Filer: {len(self.files)} PDF-filer")
         file_label.setStyleSheet("color: #D4A84B; font-size: 14px; font-weight: bold;")
         layout.addWidget(file_label)
 
@@ -164,6 +294,24 @@ class EncryptDialog(QDialog):
         perm_layout.addWidget(self.check_annotate)
 
         encrypt_layout.addWidget(perm_group)
+
+        # Algorithm
+        algo_group = QGroupBox("Kryptering")
+        algo_layout = QHBoxLayout(algo_group)
+        algo_layout.addWidget(QLabel("Algoritme:"))
+        self.combo_algorithm = QComboBox()
+        self.combo_algorithm.addItem("AES-256 (stærkest)", ENCRYPT_AES_256)
+        self.combo_algorithm.addItem("AES-128 (hurtigere)", ENCRYPT_AES_128)
+        algo_layout.addWidget(self.combo_algorithm, 1)
+        encrypt_layout.addWidget(algo_group)
+
+        # Checkbox -> flag table read by _get_permissions
+        self._perm_checks = (
+            (self.check_print, PERM_PRINT),
+            (self.check_copy, PERM_COPY),
+            (self.check_modify, PERM_MODIFY),
+            (self.check_annotate, PERM_ANNOTATE),
+        )
         encrypt_layout.addStretch()
 
         self.tabs.addTab(encrypt_tab, "Kryptér")
@@ -209,7 +357,8 @@ class EncryptDialog(QDialog):
 
     def _check_encryption_status(self):
         """Check if the PDF is already encrypted."""
-        is_encrypted, needs_pw = is_pdf_encrypted(self.files[0])
+        self._enc_status = is_pdf_encrypted(self.files[0])
+        is_encrypted, needs_pw = self._enc_status
 
         if is_encrypted:
             self.status_label.setText("🔒 PDF'en er krypteret")
@@ -220,18 +369,25 @@ class EncryptDialog(QDialog):
             self.status_label.setStyleSheet("color: #22c55e;")
             self.tabs.setCurrentIndex(0)  # Encrypt tab
 
+    def _check_existing_outputs(self):
+        """Start a background scan for output files that already exist."""
+        paths = [output_path for _, output_path in self._encrypt_jobs + self._decrypt_jobs]
+        self.output_check_worker = OutputCheckWorker(paths)
+        self.output_check_worker.finished.connect(self._on_outputs_checked)
+        self.output_check_worker.start()
+
+    def _on_outputs_checked(self, existing: set):
+        """Cache the set of existing output paths."""
+        self.output_check_worker = None
+        self._existing_outputs = existing
+
     def _get_permissions(self) -> int:
         """Get permission flags based on checkboxes."""
-        perms = 0
-        if self.check_print.isChecked():
-            perms |= PERM_PRINT
-        if self.check_copy.isChecked():
-            perms |= PERM_COPY
-        if self.check_modify.isChecked():
-            perms |= PERM_MODIFY
-        if self.check_annotate.isChecked():
-            perms |= PERM_ANNOTATE
-        return perms
+        return reduce(
+            operator.or_,
+            (flag for check, flag in self._perm_checks if check.isChecked()),
+            0
+        )
 
     def _start_operation(self):
         """Start encrypt or decrypt based on current tab."""
@@ -258,26 +414,30 @@ class EncryptDialog(QDialog):
             QMessageBox.warning(self, "Password for kort", "Password skal være mindst 4 tegn.")
             return
 
-        input_path = self.files[0]
-        output_dir = Path(input_path).parent
-        input_name = Path(input_path).stem
-        output_path = str(output_dir / f"{input_name}_encrypted.pdf")
-
-        if os.path.exists(output_path):
-            reply = QMessageBox.question(
-                self, "Fil eksisterer",
-                f"Filen eksisterer allerede. Overskriv?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply != QMessageBox.StandardButton.Yes:
-                return
+        jobs = self._encrypt_jobs
+        if not self._confirm_overwrite(jobs):
+            return
 
         self._disable_ui()
 
         permissions = self._get_permissions()
-        self.worker = EncryptWorker(input_path, output_path, user_pw, owner_pw, permissions)
+        algorithm = self.combo_algorithm.currentData()
+        if len(jobs) == 1:
+            input_path, output_path = jobs[0]
+            self.worker = EncryptWorker(
+                input_path, output_path, user_pw, owner_pw, permissions, algorithm
+            )
+            self.worker.finished.connect(self._on_finished)
+        else:
+            self.worker = BatchEncryptWorker(
+                jobs, encrypt_pdf,
+                user_password=user_pw,
+                owner_password=owner_pw,
+                permissions=permissions,
+                algorithm=algorithm
+            )
+            self.worker.finished.connect(self._on_batch_finished)
         self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
         self.worker.start()
 
@@ -289,28 +449,55 @@ class EncryptDialog(QDialog):
             QMessageBox.warning(self, "Mangler password", "Indtast password for at fjerne kryptering.")
             return
 
-        input_path = self.files[0]
-        output_dir = Path(input_path).parent
-        input_name = Path(input_path).stem
-        output_path = str(output_dir / f"{input_name}_decrypted.pdf")
-
-        if os.path.exists(output_path):
-            reply = QMessageBox.question(
-                self, "Fil eksisterer",
-                f"Filen eksisterer allerede. Overskriv?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply != QMessageBox.StandardButton.Yes:
-                return
+        jobs = self._decrypt_jobs
+        if not self._confirm_overwrite(jobs):
+            return
 
         self._disable_ui()
 
-        self.worker = DecryptWorker(input_path, output_path, password)
+        if len(jobs) == 1:
+            input_path, output_path = jobs[0]
+            # Status is already known for a single file; a plain copy in the
+            # worker replaces the no-op decrypt pass
+            self.worker = DecryptWorker(
+                input_path, output_path, password, copy_only=not self._enc_status[0]
+            )
+            self.worker.finished.connect(self._on_finished)
+        else:
+            self.worker = BatchEncryptWorker(jobs, decrypt_pdf, password=password)
+            self.worker.finished.connect(self._on_batch_finished)
         self.worker.progress.connect(self._on_progress)
-        self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
         self.worker.start()
 
+    def _build_jobs(self, suffix: str) -> list[tuple[str, str]]:
+        """Pair every selected file with its output path next to the original."""
+        jobs = []
+        for input_path in self.files:
+            path = Path(input_path)
+            jobs.append((input_path, str(path.parent / f"{path.stem}{suffix}.pdf")))
+        return jobs
+
+    def _confirm_overwrite(self, jobs: list[tuple[str, str]]) -> bool:
+        """Ask once before overwriting any existing output files."""
+        if self._existing_outputs is None:
+            # Background check hasn't finished yet; look directly
+            existing = sum(1 for _, output_path in jobs if os.path.exists(output_path))
+        else:
+            existing = sum(1 for _, output_path in jobs if output_path in self._existing_outputs)
+        if not existing:
+            return True
+
+        if len(jobs) == 1:
+            message = "Filen eksisterer allerede. Overskriv?"
+        else:
+            message = f"{existing} filer eksisterer allerede. Overskriv?"
+        reply = QMessageBox.question(
+            self, "Fil eksisterer", message,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        return reply == QMessageBox.StandardButton.Yes
+
     def _disable_ui(self):
         """Disable UI during operation."""
         self.btn_start.setEnabled(False)
@@ -326,10 +513,15 @@ class EncryptDialog(QDialog):
     def _on_finished(self, result: EncryptionResult):
         self.worker = None
         if result.success:
-            action = "krypteret" if self.tabs.currentIndex() == 0 else "dekrypteret"
+            if self.tabs.currentIndex() == 0:
+                summary = "PDF krypteret!"
+            elif not self._enc_status[0]:
+                summary = "PDF'en var ikke krypteret og er kopieret."
+            else:
+                summary = "PDF dekrypteret!"
             QMessageBox.information(
                 self, "Færdig",
-                f"PDF {action}!\n"
+                f"{summary}\n"
                 f"Gemt som: {result.output_path.name}"
             )
             self.accept()
@@ -337,12 +529,44 @@ class EncryptDialog(QDialog):
             QMessageBox.warning(self, "Fejl", result.error_message)
             self._reset_ui()
 
+    def _on_batch_finished(self, results: list[EncryptionResult]):
+        self.worker = None
+        action = "krypteret" if self.tabs.currentIndex() == 0 else "dekrypteret"
+        failed = [r for r in results if not r.success]
+        success_count = len(results) - len(failed)
+
+        if not success_count:
+            QMessageBox.warning(self, "Fejl", failed[0].error_message)
+            self._reset_ui()
+            return
+
+        message = f"{success_count}/{len(results)} PDF-filer {action}!"
+        if failed:
+            message += "\n\nFejl:\n" + "\n".join(
+                f"  • {r.output_path.name}: {r.error_message}" for r in failed
+            )
+        QMessageBox.information(self, "Færdig", message)
+        self.accept()
+
     def _on_error(self, message: str):
         self.worker = None
         QMessageBox.critical(self, "Fejl", message)
         self._reset_ui()
 
+    def done(self, result: int):
+        """Stop pending workers on every close path so no thread is destroyed mid-run."""
+        if self.output_check_worker and self.output_check_worker.isRunning():
+            self.output_check_worker.finished.disconnect(self._on_outputs_checked)
+            self.output_check_worker.wait()
+        self.output_check_worker = None
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        self.worker = None
+        super().done(result)
+
     def _reset_ui(self):
+        self._existing_outputs = None  # A failed run may have left output behind
         self.btn_start.setEnabled(True)
         self.tabs.setEnabled(True)
         self.progress_bar.setVisible(False)
@@ -6,14 +6,14 @@ from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QListWidget, QListWidgetItem, QPushButton,
+    QListWidget, QPushButton,
     QFileDialog, QMessageBox, QGroupBox
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QThread, pyqtSignal
 
-from src.ui.widgets.progress import ProgressWidget
+from src.ui.widgets.progress import ProgressWidget, ProgressThrottle
 from src.core.merger import merge_pdfs, MergeOptions, MergeResult
-from src.core.utils import format_file_size
+from src.core.utils import format_file_size, get_file_sizes
 
 
 class MergeWorker(QThread):
@@ -29,6 +29,7 @@ class MergeWorker(QThread):
         self.output_path = output_path
         self.options = options
         self._cancelled = False
+        self._throttle = ProgressThrottle()
 
     def run(self):
         """Execute merge in background thread."""
@@ -46,8 +47,8 @@ class MergeWorker(QThread):
                 self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        """Forward progress to signal."""
-        if not self._cancelled:
+        """Forward progress to signal, throttled to limit GUI thread wake-ups."""
+        if not self._cancelled and self._throttle.should_emit(percent, message):
             self.progress.emit(percent, message)
 
     def cancel(self):
@@ -60,6 +61,7 @@ class MergeDialog(QDialog):
 
     def __init__(self, files: list[str], parent=None):
         super().__init__(parent)
+        # Own copy; kept in row order with the list widget by in-place edits
         self.files = files.copy()
         self.output_path: str | None = None
         self.worker: MergeWorker | None = None
@@ -82,6 +84,7 @@ class MergeDialog(QDialog):
         self.file_list = QListWidget()
         self.file_list.setMinimumHeight(150)
         self.file_list.setDragDropMode(QListWidget.DragDropMode.InternalMove)
+        self.file_list.model().rowsMoved.connect(self._on_rows_moved)
         files_layout.addWidget(self.file_list)
 
         # Reorder buttons
@@ -139,17 +142,24 @@ class MergeDialog(QDialog):
 
     def _populate_file_list(self):
         """Fill the file list with initial files."""
+        # Batched size lookup (one listing per folder for large batches)
+        sizes = get_file_sizes(self.files)
+
+        texts = []
         for file_path in self.files:
             path = Path(file_path)
-            try:
-                size = format_file_size(path.stat().st_size)
-                text = f"{path.name}  ({size})"
-            except OSError:
-                text = path.name
-
-            item = QListWidgetItem(f"📄 {text}")
-            item.setData(Qt.ItemDataRole.UserRole, file_path)
-            self.file_list.addItem(item)
+            size_bytes = sizes.get(file_path)
+            if size_bytes is not None:
+                texts.append(f"📄 {path.name}  ({format_file_size(size_bytes)})")
+            else:
+                texts.append(f"📄 {path.name}")
+
+        # Single batch insert with repaints suspended
+        self.file_list.setUpdatesEnabled(False)
+        try:
+            self.file_list.addItems(texts)
+        finally:
+            self.file_list.setUpdatesEnabled(True)
 
     def _move_up(self):
         """Move selected file up."""
@@ -158,30 +168,31 @@ class MergeDialog(QDialog):
             item = self.file_list.takeItem(row)
             self.file_list.insertItem(row - 1, item)
             self.file_list.setCurrentRow(row - 1)
-            self._update_files_from_list()
+            self.files[row - 1], self.files[row] = self.files[row], self.files[row - 1]
 
     def _move_down(self):
         """Move selected file down."""
         row = self.file_list.currentRow()
-        if row < self.file_list.count() - 1:
+        if 0 <= row < self.file_list.count() - 1:
             item = self.file_list.takeItem(row)
             self.file_list.insertItem(row + 1, item)
             self.file_list.setCurrentRow(row + 1)
-            self._update_files_from_list()
+            self.files[row], self.files[row + 1] = self.files[row + 1], self.files[row]
 
     def _remove_selected(self):
         """Remove selected file from list."""
         row = self.file_list.currentRow()
         if row >= 0:
             self.file_list.takeItem(row)
-            self._update_files_from_list()
-
-    def _update_files_from_list(self):
-        """Sync internal file list with widget."""
-        self.files = []
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            self.files.append(item.data(Qt.ItemDataRole.UserRole))
+            del self.files[row]
+
+    def _on_rows_moved(self, parent, start: int, end: int, destination, row: int):
+        """Mirror a drag-and-drop reorder into the internal file list."""
+        moved = self.files[start:end + 1]
+        del self.files[start:end + 1]
+        if row > start:
+            row -= len(moved)
+        self.files[row:row] = moved
 
     def _browse_output(self):
         """Open file dialog for output file."""
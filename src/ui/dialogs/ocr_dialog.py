@@ -3,6 +3,9 @@ OCR dialog for text recognition processing.
 """
 
 import os
+import threading
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, wait
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -16,85 +19,144 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from src.config.settings import AppSettings
 from src.core.ocr_engine import (
     OCROptions, OCRLanguage, OCRResult,
-    perform_ocr, extract_text_only,
+    run_ocr_job, run_ocr_pool_job, init_ocr_pool_worker,
     check_tesseract_available, get_available_languages
 )
+from src.ui.workers import process_event, process_pool
 
 
 class OCRWorker(QThread):
-    """Background worker for OCR processing."""
+    """Background worker for OCR processing of one or more files."""
 
     progress = pyqtSignal(int, str)
-    finished = pyqtSignal(object)  # OCRResult
+    finished = pyqtSignal(list)  # List of OCRResult, one per input file
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()  # Emitted instead of finished/error after cancel()
+
+    # How often a batch checks for cancellation while jobs run (seconds)
+    _CANCEL_POLL_INTERVAL = 0.2
 
     def __init__(
         self,
-        input_path: str,
-        output_path: str,
+        jobs: list[tuple[str, str]],
         options: OCROptions,
         tesseract_path: str,
         extract_only: bool = False
     ):
         super().__init__()
-        self.input_path = input_path
-        self.output_path = output_path
+        self.jobs = jobs  # (input_path, output_path) pairs; output "" when extracting
         self.options = options
         self.tesseract_path = tesseract_path
         self.extract_only = extract_only
-        self._cancelled = False
+        self._cancel_event = threading.Event()
+        # Shared with the batch pool's workers so running jobs stop too
+        self._pool_cancel_event = process_event() if len(jobs) > 1 else None
 
     def run(self):
         """Execute OCR in background thread."""
         try:
-            if self.extract_only:
-                text, success, error = extract_text_only(
-                    self.input_path,
-                    self.options,
-                    self.tesseract_path,
-                    self._on_progress
-                )
-                result = OCRResult(
-                    output_path=Path(self.output_path),
-                    pages_processed=1,
-                    text_extracted=text,
-                    success=success,
-                    error_message=error
-                )
+            if len(self.jobs) == 1:
+                results = [run_ocr_job(
+                    *self.jobs[0], self.options, self.tesseract_path,
+                    self.extract_only, self._on_progress,
+                    is_cancelled=self._cancel_event.is_set
+                )]
             else:
-                result = perform_ocr(
-                    self.input_path,
-                    self.output_path,
-                    self.options,
-                    self.tesseract_path,
-                    self._on_progress
-                )
+                results = self._run_parallel()
 
-            if not self._cancelled:
-                self.finished.emit(result)
+            if not self._cancel_event.is_set():
+                self.finished.emit(results)
 
         except Exception as e:
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.error.emit(str(e))
 
+        if self._cancel_event.is_set():
+            self.cancelled.emit()
+
+    def _run_parallel(self) -> list[OCRResult]:
+        """Process files concurrently, one per process, leaving a core for the UI."""
+        total = len(self.jobs)
+        results: list[OCRResult | None] = [None] * total
+        max_workers = max(1, min(total, (os.cpu_count() or 2) - 1))
+
+        # No context manager: its exit would wait for the running jobs on cancel
+        pool = process_pool(
+            max_workers,
+            initializer=init_ocr_pool_worker,
+            initargs=(self._pool_cancel_event,)
+        )
+        try:
+            futures = {
+                pool.submit(
+                    run_ocr_pool_job, input_path, output_path, self.options,
+                    self.tesseract_path, self.extract_only
+                ): i
+                for i, (input_path, output_path) in enumerate(self.jobs)
+            }
+            pending = set(futures)
+            done = 0
+            # Wake up regularly so a cancel is seen while jobs are still running
+            while pending and not self._cancel_event.is_set():
+                completed, pending = wait(
+                    pending, timeout=self._CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                for future in completed:
+                    index = futures[future]
+                    results[index] = future.result()
+                    done += 1
+                    name = Path(self.jobs[index][0]).name
+                    self.progress.emit(int(done * 100 / total), f"{name} ({done}/{total})")
+        finally:
+            # After a cancel, running jobs kill their Tesseract and the
+            # workers exit on their own
+            pool.shutdown(wait=not self._cancel_event.is_set(), cancel_futures=True)
+
+        return results
+
     def _on_progress(self, percent: int, message: str):
         """Progress callback."""
-        if not self._cancelled:
+        if not self._cancel_event.is_set():
             self.progress.emit(percent, message)
 
     def cancel(self):
-        """Cancel the operation."""
-        self._cancelled = True
+        """Cancel the operation; running Tesseract processes are killed."""
+        self._cancel_event.set()
+        if self._pool_cancel_event is not None:
+            self._pool_cancel_event.set()
+
+
+class TesseractCheckWorker(QThread):
+    """Background worker that probes the Tesseract installation."""
+
+    finished = pyqtSignal(bool, str, list)  # available, message, languages
+
+    def __init__(self, tesseract_path: str):
+        super().__init__()
+        self.tesseract_path = tesseract_path
+
+    def run(self):
+        """Run the (subprocess-based) checks in background thread."""
+        available, message = check_tesseract_available(self.tesseract_path)
+        langs = get_available_languages(self.tesseract_path) if available else []
+        self.finished.emit(available, message, langs)
 
 
 class OCRDialog(QDialog):
     """Dialog for OCR text recognition."""
 
+    # Combobox index -> value, in the order the items are added
+    _LANGS = (OCRLanguage.DANISH, OCRLanguage.ENGLISH, OCRLanguage.DANISH_ENGLISH)
+    _LANG_INDEX = {lang.value: i for i, lang in enumerate(_LANGS)}
+    _DPIS = (150, 300, 600)
+
     def __init__(self, files: list[str], parent=None):
         super().__init__(parent)
         self.files = files
+        self._input_path = Path(files[0])
         self.settings = AppSettings()
         self.worker = None
+        self.check_worker = None
         self._setup_ui()
         self._check_tesseract()
 
@@ -108,7 +170,7 @@ class OCRDialog(QDialog):
         layout.setSpacing(15)
 
         # File info
-        file_info = QLabel(f"Fil: {Path(self.files[0]).name}")
+        file_info = QLabel(f"Fil: {self._input_path.name}")
         file_info.setStyleSheet("color: #D4A84B; font-size: 14px; font-weight: bold;")
         layout.addWidget(file_info)
 
@@ -185,7 +247,7 @@ class OCRDialog(QDialog):
         # Output directory
         dir_layout = QHBoxLayout()
         dir_layout.addWidget(QLabel("Gem i:"))
-        self.label_output_dir = QLabel(str(Path(self.files[0]).parent))
+        self.label_output_dir = QLabel(str(self._input_path.parent))
         self.label_output_dir.setStyleSheet("color: #7FBFB5;")
         self.label_output_dir.setWordWrap(True)
         dir_layout.addWidget(self.label_output_dir, 1)
@@ -244,9 +306,15 @@ class OCRDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def _check_tesseract(self):
-        """Check if Tesseract is available."""
-        tesseract_path = self.settings.tesseract_path
-        available, message = check_tesseract_available(tesseract_path)
+        """Check in the background if Tesseract is available."""
+        # btn_start stays disabled and the status reads "Kontrollerer..." until done
+        self.check_worker = TesseractCheckWorker(self.settings.tesseract_path)
+        self.check_worker.finished.connect(self._on_tesseract_checked)
+        self.check_worker.start()
+
+    def _on_tesseract_checked(self, available: bool, message: str, langs: list):
+        """Show Tesseract status."""
+        self.check_worker = None
 
         if available:
             self.status_icon.setText("✓")
@@ -256,7 +324,6 @@ class OCRDialog(QDialog):
             self.btn_start.setEnabled(True)
 
             # Check for Danish language
-            langs = get_available_languages(tesseract_path)
             if 'dan' not in langs:
                 self.status_label.setText(
                     f"{message}\n⚠ Dansk sprogpakke ikke fundet. "
@@ -272,43 +339,22 @@ class OCRDialog(QDialog):
 
     def _load_language_setting(self):
         """Load saved language preference."""
-        lang = self.settings.default_language
-        if lang == "dan":
-            self.combo_language.setCurrentIndex(0)
-        elif lang == "eng":
-            self.combo_language.setCurrentIndex(1)
-        else:
-            self.combo_language.setCurrentIndex(2)
+        self.combo_language.setCurrentIndex(
+            self._LANG_INDEX.get(self.settings.default_language, len(self._LANGS) - 1)
+        )
 
     def _load_dpi_setting(self):
-        """Load saved DPI preference."""
-        dpi = self.settings.ocr_dpi
-        if dpi <= 150:
-            self.combo_dpi.setCurrentIndex(0)
-        elif dpi <= 300:
-            self.combo_dpi.setCurrentIndex(1)
-        else:
-            self.combo_dpi.setCurrentIndex(2)
+        """Load saved DPI preference (rounded up to the next offered DPI)."""
+        index = bisect_left(self._DPIS, self.settings.ocr_dpi)
+        self.combo_dpi.setCurrentIndex(min(index, len(self._DPIS) - 1))
 
     def _get_language(self) -> OCRLanguage:
         """Get selected language."""
-        idx = self.combo_language.currentIndex()
-        if idx == 0:
-            return OCRLanguage.DANISH
-        elif idx == 1:
-            return OCRLanguage.ENGLISH
-        else:
-            return OCRLanguage.DANISH_ENGLISH
+        return self._LANGS[self.combo_language.currentIndex()]
 
     def _get_dpi(self) -> int:
         """Get selected DPI."""
-        idx = self.combo_dpi.currentIndex()
-        if idx == 0:
-            return 150
-        elif idx == 1:
-            return 300
-        else:
-            return 600
+        return self._DPIS[self.combo_dpi.currentIndex()]
 
     def _browse_output(self):
         """Browse for output directory."""
@@ -338,28 +384,39 @@ class OCRDialog(QDialog):
             preserve_original=self.check_preserve.isChecked()
         )
 
-        input_path = self.files[0]
         extract_only = self.check_extract_only.isChecked()
 
-        # Generate output path
+        # Generate output paths
         if not extract_only:
             output_dir = Path(self.label_output_dir.text())
-            input_name = Path(input_path).stem
-            output_path = str(output_dir / f"{input_name}_ocr.pdf")
-
-            # Check if output exists
-            if os.path.exists(output_path):
+            jobs = [
+                (input_path, str(output_dir / f"{Path(input_path).stem}_ocr.pdf"))
+                for input_path in self.files
+            ]
+
+            # Check if outputs exist
+            existing = [output_path for _, output_path in jobs if os.path.exists(output_path)]
+            if existing:
+                if len(existing) == 1:
+                    question = (
+                        f"Filen '{Path(existing[0]).name}' eksisterer allerede.\n"
+                        "Vil du overskrive den?"
+                    )
+                else:
+                    question = (
+                        f"{len(existing)} filer eksisterer allerede.\n"
+                        "Vil du overskrive dem?"
+                    )
                 reply = QMessageBox.question(
                     self,
                     "Fil eksisterer",
-                    f"Filen '{Path(output_path).name}' eksisterer allerede.\n"
-                    "Vil du overskrive den?",
+                    question,
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                 )
                 if reply != QMessageBox.StandardButton.Yes:
                     return
         else:
-            output_path = ""
+            jobs = [(input_path, "") for input_path in self.files]
 
         # Disable UI
         self.btn_start.setEnabled(False)
@@ -377,8 +434,7 @@ class OCRDialog(QDialog):
 
         # Start worker
         self.worker = OCRWorker(
-            input_path,
-            output_path,
+            jobs,
             options,
             self.settings.tesseract_path,
             extract_only
@@ -386,6 +442,7 @@ class OCRDialog(QDialog):
         self.worker.progress.connect(self._on_progress)
         self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
+        self.worker.cancelled.connect(self._on_worker_cancelled)
         self.worker.start()
 
     def _on_progress(self, percent: int, message: str):
@@ -393,10 +450,19 @@ class OCRDialog(QDialog):
         self.progress_bar.setValue(percent)
         self.progress_label.setText(message)
 
-    def _on_finished(self, result: OCRResult):
+    def _on_finished(self, results: list[OCRResult]):
         """Handle OCR completion."""
         self.worker = None
 
+        if len(results) == 1:
+            self._show_single_result(results[0])
+        else:
+            self._show_batch_results(results)
+
+        self._reset_ui()
+
+    def _show_single_result(self, result: OCRResult):
+        """Report the outcome of a single-file run."""
         if result.success:
             if self.check_extract_only.isChecked():
                 # Show extracted text
@@ -426,7 +492,40 @@ class OCRDialog(QDialog):
                 f"OCR fejlede:\n{result.error_message}"
             )
 
-        self._reset_ui()
+    def _show_batch_results(self, results: list[OCRResult]):
+        """Report the outcome of a multi-file run."""
+        names = [Path(f).name for f in self.files]
+        failed = [(name, r) for name, r in zip(names, results) if not r.success]
+        success_count = len(results) - len(failed)
+
+        errors = "".join(f"\n  • {name}: {r.error_message}" for name, r in failed)
+        if errors:
+            errors = f"\n\nFejl:{errors}"
+
+        if self.check_extract_only.isChecked():
+            self.text_preview.setText("\n\n".join(
+                f"=== {name} ===\n{r.text_extracted}"
+                for name, r in zip(names, results) if r.success
+            ))
+            self.progress_label.setText("Tekst udtrukket!")
+            QMessageBox.information(
+                self,
+                "OCR Færdig",
+                f"Tekst udtrukket fra {success_count}/{len(results)} filer.\n"
+                f"Teksten er vist nedenfor og kan kopieres.{errors}"
+            )
+        elif success_count:
+            pages = sum(r.pages_processed for r in results if r.success)
+            QMessageBox.information(
+                self,
+                "OCR Færdig",
+                f"OCR gennemført!\n\n"
+                f"Filer behandlet: {success_count}/{len(results)}\n"
+                f"Sider behandlet: {pages}{errors}"
+            )
+            self.accept()
+        else:
+            QMessageBox.warning(self, "OCR Fejl", f"OCR fejlede for alle filer.{errors}")
 
     def _on_error(self, message: str):
         """Handle OCR error."""
@@ -448,18 +547,36 @@ class OCRDialog(QDialog):
         self.btn_browse.setEnabled(not self.check_extract_only.isChecked())
         self.progress_bar.setVisible(False)
 
+    def _stop_check_worker(self):
+        """Wait for a pending Tesseract check so its thread isn't destroyed mid-run."""
+        if self.check_worker and self.check_worker.isRunning():
+            self.check_worker.finished.disconnect(self._on_tesseract_checked)
+            self.check_worker.wait()
+        self.check_worker = None
+
     def _on_cancel(self):
         """Handle cancel button."""
-        if self.worker and self.worker.isRunning():
-            self.worker.cancel()
-            self.worker.wait(1000)
-            self.worker = None
-
         self.reject()
 
-    def closeEvent(self, event):
-        """Handle dialog close."""
+    def reject(self):
+        """
+        Close the dialog (cancel button, Esc or window X).
+
+        A running worker is signalled and the dialog closes once it reports
+        back, so the event loop is never blocked and the thread is never
+        destroyed while still running.
+        """
+        self._stop_check_worker()
         if self.worker and self.worker.isRunning():
             self.worker.cancel()
-            self.worker.wait(1000)
-        event.accept()
+            self.btn_start.setEnabled(False)
+            self.btn_cancel.setEnabled(False)
+            self.progress_label.setText("Annullerer...")
+            return
+        super().reject()
+
+    def _on_worker_cancelled(self):
+        """Finish closing once a cancelled worker has stopped."""
+        self.worker.wait()  # run() returns right after emitting
+        self.worker = None
+        self.reject()
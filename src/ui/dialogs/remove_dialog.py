@@ -2,20 +2,29 @@
 Remove pages dialog.
 """
 
+import array
 import os
+from concurrent.futures import as_completed
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QMessageBox, QGroupBox,
     QLineEdit, QProgressBar, QListWidget,
-    QListWidgetItem, QAbstractItemView
+    QListWidgetItem, QAbstractItemView, QStyledItemDelegate
+)
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QSize, QStandardPaths
+from PyQt6.QtGui import QPixmap, QPixmapCache, QIcon, QImage
+
+from src.ui.widgets.progress import ProgressThrottle
+from src.ui.workers import shared_process_pool
+from src.core.page_ops import (
+    remove_pages, get_page_thumbnails, render_thumbnail_range,
+    PageOpResult, PageThumbnail
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap, QIcon
-
-from src.core.page_ops import remove_pages, get_page_thumbnails, PageOpResult
 from src.core.pdf_handler import get_pdf_info
+from src.core.thumbnail_cache import ThumbnailCache
+from src.core.utils import parse_page_ranges
 
 
 class RemoveWorker(QThread):
@@ -25,11 +34,12 @@ class RemoveWorker(QThread):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
-    def __init__(self, input_path: str, output_path: str, pages: list[int]):
+    def __init__(self, input_path: str, output_path: str, pages: array.array):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
         self.pages = pages
+        self._throttle = ProgressThrottle()
 
     def run(self):
         try:
@@ -44,35 +54,195 @@ class RemoveWorker(QThread):
             self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        self.progress.emit(percent, message)
+        """Forward progress to signal, throttled to limit GUI thread wake-ups."""
+        if self._throttle.should_emit(percent, message):
+            self.progress.emit(percent, message)
+
+
+# Thumbnail rendering: below this page count handing blocks to the shared
+# process pool costs more than it saves; above it pages are rendered in
+# blocks across cores
+_THUMB_MAX_SIZE = 100
+_THUMB_PARALLEL_MIN_PAGES = 24
+_THUMB_BLOCK_SIZE = 8
+
+
+def _thumbnail_cache() -> ThumbnailCache:
+    """Thumbnail cache under the user's cache directory."""
+    root = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.GenericCacheLocation
+    )
+    return ThumbnailCache(Path(root) / "pdf_toolkit" / "thumbnails")
+
+
+def _thumbnail_image(thumb: PageThumbnail) -> QImage:
+    """Wrap raw pixels in a QImage; copy() detaches it from the bytes buffer."""
+    return QImage(
+        thumb.samples, thumb.width, thumb.height, thumb.stride,
+        QImage.Format.Format_RGB888
+    ).copy()
+
+
+class _ThumbnailDelegate(QStyledItemDelegate):
+    """Paints page icons from QPixmapCache instead of pixmaps held per item."""
+
+    def __init__(self, lookup, parent=None):
+        super().__init__(parent)
+        self._lookup = lookup  # page_num -> QPixmap | None; must not block
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        pixmap = self._lookup(index.data(Qt.ItemDataRole.UserRole))
+        if pixmap is not None:
+            option.icon = QIcon(pixmap)
 
 
 class ThumbnailLoader(QThread):
     """Background worker for loading thumbnails."""
 
-    thumbnail_ready = pyqtSignal(int, bytes)  # page_num, png_bytes
+    thumbnail_ready = pyqtSignal(int, QImage, bool)  # page_num, image, in disk cache
     finished = pyqtSignal()
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, page_count: int, cache: ThumbnailCache | None = None):
         super().__init__()
         self.pdf_path = pdf_path
+        self.page_count = page_count
+        self.cache = cache
+        self._cache_key: str | None = None
+        self._stored_any = False  # Something was written, so the cache may be over budget
 
     def run(self):
-        thumbnails = get_page_thumbnails(self.pdf_path, max_size=100)
-        for page_num, png_bytes in thumbnails:
-            self.thumbnail_ready.emit(page_num, png_bytes)
+        if self.cache is not None:
+            self._cache_key = self.cache.key_for(self.pdf_path, _THUMB_MAX_SIZE)
+            if self._cache_key and self._emit_cached():
+                return
+
+        if self.page_count >= _THUMB_PARALLEL_MIN_PAGES:
+            self._run_parallel()
+        else:
+            self._run_sequential()
+
+        if self._stored_any:
+            self.cache.evict()
+
+    def _emit_cached(self) -> bool:
+        """Emit thumbnails straight from the disk cache if all pages are there."""
+        thumbnails = self.cache.load(self._cache_key, self.page_count)
+        if thumbnails is None:
+            return False
+        for thumb in thumbnails:
+            if self.isInterruptionRequested():
+                return True
+            self._emit_image(thumb, True)
+        self.finished.emit()
+        return True
+
+    def _emit(self, thumb: PageThumbnail):
+        """Store a freshly rendered thumbnail in the cache and emit it."""
+        stored = bool(self._cache_key) and self.cache.store(self._cache_key, thumb)
+        self._stored_any |= stored
+        self._emit_image(thumb, stored)
+
+    def _emit_image(self, thumb: PageThumbnail, stored: bool):
+        """Emit a thumbnail as a QImage."""
+        self.thumbnail_ready.emit(thumb.page_num, _thumbnail_image(thumb), stored)
+
+    def _run_parallel(self):
+        """Render blocks of pages in worker processes, emitting as blocks finish."""
+        # Session-wide pool: worker startup is paid once, not per dialog open
+        pool = shared_process_pool()
+        futures = [
+            pool.submit(
+                render_thumbnail_range, self.pdf_path,
+                start, start + _THUMB_BLOCK_SIZE, _THUMB_MAX_SIZE
+            )
+            for start in range(0, self.page_count, _THUMB_BLOCK_SIZE)
+        ]
+        for future in as_completed(futures):
+            if self.isInterruptionRequested():
+                # The pool is shared: drop only this file's queued blocks
+                for pending in futures:
+                    pending.cancel()
+                return
+            try:
+                thumbnails = future.result()
+            except Exception:
+                continue  # Leave this block's placeholders in place
+            for thumb in thumbnails:
+                self._emit(thumb)
+        self.finished.emit()
+
+    def _run_sequential(self):
+        """Render pages in this thread, emitting each as soon as it is ready."""
+        # Stop early if interrupted
+        thumbnails = get_page_thumbnails(self.pdf_path, max_size=_THUMB_MAX_SIZE)
+        try:
+            for thumb in thumbnails:
+                if self.isInterruptionRequested():
+                    return
+                self._emit(thumb)
+        finally:
+            thumbnails.close()
         self.finished.emit()
 
 
+class ThumbnailReloader(QThread):
+    """Background worker that reloads thumbnails evicted from QPixmapCache."""
+
+    thumbnail_ready = pyqtSignal(int, QImage, bool)  # page_num, image, in disk cache
+
+    def __init__(self, pdf_path: str, pages: list[int], cache: ThumbnailCache, key: str):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.pages = pages
+        self.cache = cache
+        self.key = key
+
+    def run(self):
+        for page_num in self.pages:
+            if self.isInterruptionRequested():
+                return
+            thumb = self.cache.load_page(self.key, page_num)
+            stored = thumb is not None
+            if thumb is None:
+                # Evicted from the disk cache as well: render the page again
+                try:
+                    thumb, = render_thumbnail_range(
+                        self.pdf_path, page_num - 1, page_num, _THUMB_MAX_SIZE
+                    )
+                except Exception:
+                    continue  # Leave the placeholder in place
+                stored = self.cache.store(self.key, thumb)
+            self.thumbnail_ready.emit(page_num, _thumbnail_image(thumb), stored)
+
+
 class RemoveDialog(QDialog):
     """Dialog for removing PDF pages."""
 
     def __init__(self, files: list[str], parent=None):
         super().__init__(parent)
         self.files = files
+        self._input_path = Path(files[0])
         self.worker = None
         self.thumb_loader = None
+        self.thumb_reloader = None
         self.page_count = 0
+        self._selected_count = 0  # Maintained from selection deltas
+
+        # Icons are painted from the bounded QPixmapCache; pages evicted from
+        # it are reloaded from the disk cache in the background. Pages that
+        # aren't on disk (store failed, or no cache key because the file
+        # can't be stat'ed) keep their own item icon instead.
+        self._thumb_cache = _thumbnail_cache()
+        self._thumb_key = self._thumb_cache.key_for(files[0], _THUMB_MAX_SIZE)
+        self._thumb_delivered = bytearray()  # 1 = page thumbnail is in the disk cache
+        self._reload_pages: list[int] = []  # Evicted pages waiting for a reload
+
+        # Thumbnails arriving between frames are applied together
+        self._pending_thumbs: dict[int, tuple[QImage, bool]] = {}
+        self._thumb_flush_timer = QTimer(self)
+        self._thumb_flush_timer.setInterval(16)  # ~one frame
+        self._thumb_flush_timer.timeout.connect(self._flush_thumbnails)
         self._setup_ui()
         self._load_file_info()
 
@@ -86,8 +256,7 @@ class RemoveDialog(QDialog):
         layout.setSpacing(15)
 
         # File info
-        file_name = Path(self.files[0]).name
-        file_label = QLabel(f"Fil: {file_name}")
+        file_label = QLabel(f"Fil: {self._input_path.name}")
         file_label.setStyleSheet("color: #D4A84B; font-size: 14px; font-weight: bold;")
         layout.addWidget(file_label)
 
@@ -107,6 +276,10 @@ class RemoveDialog(QDialog):
         self.page_list.setIconSize(QSize(80, 100))
         self.page_list.setSpacing(10)
         self.page_list.setMinimumHeight(250)
+        if self._thumb_key:
+            self.page_list.setItemDelegate(
+                _ThumbnailDelegate(self._cached_thumbnail, self.page_list)
+            )
         layout.addWidget(self.page_list)
 
         # Alternative: manual entry
@@ -156,8 +329,8 @@ class RemoveDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
-        # Connect selection change
-        self.page_list.itemSelectionChanged.connect(self._update_selection_info)
+        # Connect selection change - deltas only, no recount of all items
+        self.page_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
     def _load_file_info(self):
         """Load file information and thumbnails."""
@@ -166,35 +339,113 @@ class RemoveDialog(QDialog):
             self.page_count = info.page_count
             self.info_label.setText(f"{self.page_count} sider")
 
-            # Add placeholder items
-            for i in range(self.page_count):
-                item = QListWidgetItem(f"Side {i + 1}")
-                item.setData(Qt.ItemDataRole.UserRole, i + 1)
-                self.page_list.addItem(item)
+            self._thumb_delivered = bytearray(self.page_count + 1)
+
+            # One shared blank icon reserves the icon area of every item
+            placeholder = QPixmap(self.page_list.iconSize())
+            placeholder.fill(Qt.GlobalColor.transparent)
+            placeholder_icon = QIcon(placeholder)
+
+            # Add placeholder items in one batch with repaints suspended
+            self.page_list.setUpdatesEnabled(False)
+            try:
+                for i in range(self.page_count):
+                    item = QListWidgetItem(placeholder_icon, f"Side {i + 1}")
+                    item.setData(Qt.ItemDataRole.UserRole, i + 1)
+                    self.page_list.addItem(item)
+            finally:
+                self.page_list.setUpdatesEnabled(True)
+                self.page_list.doItemsLayout()
 
             # Load thumbnails in background
-            self.thumb_loader = ThumbnailLoader(self.files[0])
+            self.thumb_loader = ThumbnailLoader(
+                self.files[0], self.page_count, self._thumb_cache
+            )
             self.thumb_loader.thumbnail_ready.connect(
                 self._on_thumbnail_ready,
                 Qt.ConnectionType.QueuedConnection
             )
+            self.thumb_loader.finished.connect(self._on_thumbnails_finished)
             self.thumb_loader.start()
 
         except Exception as e:
             self.info_label.setText(f"Fejl: {e}")
 
-    def _on_thumbnail_ready(self, page_num: int, png_bytes: bytes):
-        """Handle thumbnail loaded."""
-        if page_num <= self.page_list.count():
-            item = self.page_list.item(page_num - 1)
-            # Disable updates while setting icon to avoid QPainter conflicts
-            self.page_list.setUpdatesEnabled(False)
-            try:
-                pixmap = QPixmap()
-                pixmap.loadFromData(png_bytes)
-                item.setIcon(QIcon(pixmap))
-            finally:
-                self.page_list.setUpdatesEnabled(True)
+    def _on_thumbnail_ready(self, page_num: int, image: QImage, stored: bool):
+        """Queue a loaded thumbnail for the next flush."""
+        self._pending_thumbs[page_num] = (image, stored)
+        if not self._thumb_flush_timer.isActive():
+            self._thumb_flush_timer.start()
+
+    def _flush_thumbnails(self):
+        """Apply all queued thumbnails with a single relayout/repaint."""
+        if not self._pending_thumbs:
+            self._thumb_flush_timer.stop()
+            return
+
+        pending, self._pending_thumbs = self._pending_thumbs, {}
+        count = self.page_list.count()
+        # Disable updates while setting icons to avoid QPainter conflicts
+        self.page_list.setUpdatesEnabled(False)
+        try:
+            for page_num, (image, stored) in pending.items():
+                if page_num > count:
+                    continue
+                if stored:
+                    QPixmapCache.insert(self._pixmap_key(page_num), QPixmap.fromImage(image))
+                    self._thumb_delivered[page_num] = 1
+                else:
+                    # Can't be reloaded from disk: the item holds the pixmap
+                    item = self.page_list.item(page_num - 1)
+                    item.setIcon(QIcon(QPixmap.fromImage(image)))
+        finally:
+            self.page_list.setUpdatesEnabled(True)
+            self.page_list.viewport().update()
+
+    def _pixmap_key(self, page_num: int) -> str:
+        """QPixmapCache key of a page thumbnail for this file version."""
+        return f"remove-thumb:{self._thumb_key}:{page_num}"
+
+    def _cached_thumbnail(self, page_num: int) -> QPixmap | None:
+        """
+        Pixmap for a page, or None to paint the item's own icon.
+
+        Called while painting, so a page evicted from QPixmapCache is only
+        queued for a background reload; it shows its placeholder until then.
+        """
+        pixmap = QPixmapCache.find(self._pixmap_key(page_num))
+        if pixmap is None and self._thumb_delivered[page_num]:
+            self._thumb_delivered[page_num] = 0  # Requested; set again on arrival
+            self._reload_pages.append(page_num)
+            if len(self._reload_pages) == 1:
+                QTimer.singleShot(0, self._start_reload)
+        return pixmap
+
+    def _start_reload(self):
+        """Reload queued evicted pages in the background, one batch at a time."""
+        if not self._reload_pages or (self.thumb_reloader and self.thumb_reloader.isRunning()):
+            return  # A running reload picks up the queue when it finishes
+        pages, self._reload_pages = self._reload_pages, []
+        self.thumb_reloader = ThumbnailReloader(
+            self.files[0], pages, self._thumb_cache, self._thumb_key
+        )
+        self.thumb_reloader.thumbnail_ready.connect(
+            self._on_thumbnail_ready,
+            Qt.ConnectionType.QueuedConnection
+        )
+        self.thumb_reloader.finished.connect(self._on_reload_finished)
+        self.thumb_reloader.start()
+
+    def _on_reload_finished(self):
+        """Apply reloaded thumbnails and start on pages evicted meanwhile."""
+        self.thumb_reloader = None
+        self._flush_thumbnails()
+        self._start_reload()
+
+    def _on_thumbnails_finished(self):
+        """Apply the last queued thumbnails and stop flushing."""
+        self._flush_thumbnails()
+        self._thumb_flush_timer.stop()
 
     def _select_all(self):
         """Select all pages."""
@@ -204,9 +455,16 @@ class RemoveDialog(QDialog):
         """Deselect all pages."""
         self.page_list.clearSelection()
 
+    def _on_selection_changed(self, selected, deselected):
+        """Track the selection count from the changed ranges only."""
+        self._selected_count += (
+            sum(r.height() for r in selected) - sum(r.height() for r in deselected)
+        )
+        self._update_selection_info()
+
     def _update_selection_info(self):
         """Update selection count label."""
-        count = len(self.page_list.selectedItems())
+        count = self._selected_count
         self.selection_label.setText(f"{count} sider valgt til fjernelse")
 
         if count >= self.page_count:
@@ -217,42 +475,36 @@ class RemoveDialog(QDialog):
         else:
             self.selection_label.setStyleSheet("color: #7FBFB5;")
 
-    def _get_pages_to_remove(self) -> list[int]:
-        """Get list of pages to remove."""
+    def _get_pages_to_remove(self) -> array.array:
+        """
+        Get pages to remove: sorted, unique and within the document,
+        as a compact int array (4 bytes per page).
+        """
         # Check manual entry first
         manual_text = self.edit_pages.text().strip()
         if manual_text:
-            pages = []
-            parts = manual_text.split(",")
-            for part in parts:
-                part = part.strip()
-                if "-" in part:
-                    try:
-                        start, end = part.split("-")
-                        pages.extend(range(int(start), int(end) + 1))
-                    except ValueError:
-                        continue
-                else:
-                    try:
-                        pages.append(int(part))
-                    except ValueError:
-                        continue
-            return pages
-
-        # Otherwise use list selection
-        pages = []
-        for item in self.page_list.selectedItems():
-            page_num = item.data(Qt.ItemDataRole.UserRole)
-            pages.append(page_num)
+            return array.array(
+                'i', (p + 1 for p in parse_page_ranges(manual_text, self.page_count))
+            )
 
-        return sorted(pages)
+        # Otherwise use list selection (already unique and in range)
+        return array.array('i', sorted(
+            item.data(Qt.ItemDataRole.UserRole) for item in self.page_list.selectedItems()
+        ))
 
     def _start_removal(self):
         """Start page removal."""
         pages = self._get_pages_to_remove()
 
         if not pages:
-            QMessageBox.warning(self, "Ingen sider valgt", "Vælg mindst én side at fjerne.")
+            if self.edit_pages.text().strip():
+                QMessageBox.warning(
+                    self, "Ugyldige sider",
+                    f"Ingen gyldige sider fundet (1-{self.page_count}).\n\n"
+                    "Brug formatet: 1, 3, 5-7"
+                )
+            else:
+                QMessageBox.warning(self, "Ingen sider valgt", "Vælg mindst én side at fjerne.")
             return
 
         if len(pages) >= self.page_count:
@@ -271,9 +523,7 @@ class RemoveDialog(QDialog):
             return
 
         input_path = self.files[0]
-        output_dir = Path(input_path).parent
-        input_name = Path(input_path).stem
-        output_path = str(output_dir / f"{input_name}_modified.pdf")
+        output_path = str(self._input_path.parent / f"{self._input_path.stem}_modified.pdf")
 
         if os.path.exists(output_path):
             reply = QMessageBox.question(
@@ -322,10 +572,16 @@ class RemoveDialog(QDialog):
         self.progress_bar.setVisible(False)
         self.progress_label.setVisible(False)
 
+    def done(self, result: int):
+        """Stop thumbnail rendering on every close path (accept/reject/close)."""
+        self._reload_pages.clear()
+        for loader in (self.thumb_loader, self.thumb_reloader):
+            if loader and loader.isRunning():
+                loader.requestInterruption()
+                loader.wait()
+        super().done(result)
+
     def closeEvent(self, event):
-        if self.thumb_loader and self.thumb_loader.isRunning():
-            self.thumb_loader.quit()
-            self.thumb_loader.wait(500)
         if self.worker and self.worker.isRunning():
             self.worker.wait(500)
         event.accept()
@@ -13,8 +13,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
+from src.ui.widgets.progress import ProgressThrottle
+from src.ui.workers import PdfInfoWorker
 from src.core.page_ops import rotate_pages, RotationAngle, PageOpResult
-from src.core.pdf_handler import get_pdf_info
+from src.core.pdf_handler import PDFInfo
+from src.core.utils import parse_page_ranges
 
 
 class RotateWorker(QThread):
@@ -30,6 +33,7 @@ class RotateWorker(QThread):
         self.output_path = output_path
         self.angle = angle
         self.pages = pages
+        self._throttle = ProgressThrottle()
 
     def run(self):
         try:
@@ -45,7 +49,9 @@ class RotateWorker(QThread):
             self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        self.progress.emit(percent, message)
+        """Forward progress to signal, throttled to limit GUI thread wake-ups."""
+        if self._throttle.should_emit(percent, message):
+            self.progress.emit(percent, message)
 
 
 class RotateDialog(QDialog):
@@ -54,7 +60,9 @@ class RotateDialog(QDialog):
     def __init__(self, files: list[str], parent=None):
         super().__init__(parent)
         self.files = files
+        self._input_path = Path(files[0])
         self.worker = None
+        self.info_worker = None
         self.page_count = 0
         self._setup_ui()
         self._load_file_info()
@@ -69,8 +77,7 @@ class RotateDialog(QDialog):
         layout.setSpacing(15)
 
         # File info
-        file_name = Path(self.files[0]).name
-        file_label = QLabel(f"Fil: {file_name}")
+        file_label = QLabel(f"Fil: {self._input_path.name}")
         file_label.setStyleSheet("color: #D4A84B; font-size: 14px; font-weight: bold;")
         layout.addWidget(file_label)
 
@@ -137,18 +144,32 @@ class RotateDialog(QDialog):
         self.btn_start = QPushButton("Rotér")
         self.btn_start.setProperty("class", "action-btn")
         self.btn_start.clicked.connect(self._start_rotation)
+        self.btn_start.setEnabled(False)  # Until the page count has loaded
         btn_layout.addWidget(self.btn_start)
 
         layout.addLayout(btn_layout)
 
     def _load_file_info(self):
-        """Load file information."""
-        try:
-            info = get_pdf_info(self.files[0])
-            self.page_count = info.page_count
-            self.info_label.setText(f"{self.page_count} sider")
-        except Exception:
-            self.info_label.setText("Kunne ikke læse fil info")
+        """Load file information in the background."""
+        self.info_worker = PdfInfoWorker(self.files[0])
+        self.info_worker.finished.connect(self._on_info_loaded)
+        self.info_worker.error.connect(self._on_info_error)
+        self.info_worker.start()
+
+    def _on_info_loaded(self, info: PDFInfo):
+        self.page_count = info.page_count
+        self.info_label.setText(f"{self.page_count} sider")
+        self.btn_start.setEnabled(True)
+
+    def _on_info_error(self, message: str):
+        # Without a page count no selection can be validated: stay disabled
+        self.info_label.setText("Kunne ikke læse fil info")
+
+    def done(self, result: int):
+        """Wait for the info worker on every close path (accept, reject, X)."""
+        if self.info_worker and self.info_worker.isRunning():
+            self.info_worker.wait()
+        super().done(result)
 
     def _on_all_pages_changed(self, state):
         """Handle all pages checkbox change."""
@@ -164,7 +185,10 @@ class RotateDialog(QDialog):
             return RotationAngle.CCW_90
 
     def _parse_pages(self) -> list[int] | None:
-        """Parse page selection. Returns None for all pages."""
+        """
+        Parse page selection. Returns None for all pages, and an empty
+        list if text was entered but contains no valid pages.
+        """
         if self.check_all_pages.isChecked():
             return None
 
@@ -172,31 +196,22 @@ class RotateDialog(QDialog):
         if not text:
             return None
 
-        pages = []
-        parts = text.split(",")
-
-        for part in parts:
-            part = part.strip()
-            if "-" in part:
-                try:
-                    start, end = part.split("-")
-                    pages.extend(range(int(start), int(end) + 1))
-                except ValueError:
-                    continue
-            else:
-                try:
-                    pages.append(int(part))
-                except ValueError:
-                    continue
-
-        return pages if pages else None
+        # Unique, in-range pages (1-indexed)
+        return [p + 1 for p in parse_page_ranges(text, self.page_count)]
 
     def _start_rotation(self):
         """Start rotation operation."""
+        pages = self._parse_pages()
+        if pages is not None and not pages:
+            QMessageBox.warning(
+                self, "Ugyldige sider",
+                f"Ingen gyldige sider fundet (1-{self.page_count}).\n\n"
+                "Brug formatet: 1, 3, 5-7"
+            )
+            return
+
         input_path = self.files[0]
-        output_dir = Path(input_path).parent
-        input_name = Path(input_path).stem
-        output_path = str(output_dir / f"{input_name}_rotated.pdf")
+        output_path = str(self._input_path.parent / f"{self._input_path.stem}_rotated.pdf")
 
         if os.path.exists(output_path):
             reply = QMessageBox.question(
@@ -213,7 +228,6 @@ class RotateDialog(QDialog):
         self.progress_label.setVisible(True)
 
         angle = self._get_angle()
-        pages = self._parse_pages()
 
         self.worker = RotateWorker(input_path, output_path, angle, pages)
         self.worker.progress.connect(self._on_progress)
@@ -2,6 +2,7 @@
 Application settings dialog.
 """
 
+from bisect import bisect_left
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -16,6 +17,11 @@ from src.config.settings import AppSettings
 class SettingsDialog(QDialog):
     """Dialog for configuring application settings."""
 
+    # Combobox index -> stored value, in the order the items are added
+    _LANGS = ("dan", "eng", "dan+eng")
+    _DPIS = (150, 300, 600)
+    _COMPRESSION_LEVELS = ("high", "balanced", "maximum")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = AppSettings()
@@ -142,77 +148,54 @@ class SettingsDialog(QDialog):
         # Tesseract path
         self.edit_tesseract.setText(self.settings.tesseract_path)
 
-        # Language
-        lang = self.settings.default_language
-        if lang == "dan":
-            self.combo_language.setCurrentIndex(0)
-        elif lang == "eng":
-            self.combo_language.setCurrentIndex(1)
-        else:
-            self.combo_language.setCurrentIndex(2)
+        # Language (unknown values select the last entry)
+        self.combo_language.setCurrentIndex(
+            self._index_of(self._LANGS, self.settings.default_language)
+        )
 
-        # DPI
-        dpi = self.settings.ocr_dpi
-        if dpi <= 150:
-            self.combo_dpi.setCurrentIndex(0)
-        elif dpi <= 300:
-            self.combo_dpi.setCurrentIndex(1)
-        else:
-            self.combo_dpi.setCurrentIndex(2)
+        # DPI (rounded up to the next offered DPI)
+        dpi_index = bisect_left(self._DPIS, self.settings.ocr_dpi)
+        self.combo_dpi.setCurrentIndex(min(dpi_index, len(self._DPIS) - 1))
 
         # Output directory
         if self.settings.output_directory:
             self.edit_output_dir.setText(str(self.settings.output_directory))
 
-        # Compression level
-        level = self.settings.compression_level
-        if level == "high":
-            self.combo_compression.setCurrentIndex(0)
-        elif level == "balanced":
-            self.combo_compression.setCurrentIndex(1)
-        else:
-            self.combo_compression.setCurrentIndex(2)
+        # Compression level (unknown values select the last entry)
+        self.combo_compression.setCurrentIndex(
+            self._index_of(self._COMPRESSION_LEVELS, self.settings.compression_level)
+        )
+
+    @staticmethod
+    def _index_of(values: tuple, value) -> int:
+        """Index of a stored value, falling back to the last entry."""
+        try:
+            return values.index(value)
+        except ValueError:
+            return len(values) - 1
 
     def _save_settings(self):
         """Save settings from UI."""
-        # Tesseract path
-        self.settings.tesseract_path = self.edit_tesseract.text().strip()
-
-        # Language
-        lang_index = self.combo_language.currentIndex()
-        if lang_index == 0:
-            self.settings.default_language = "dan"
-        elif lang_index == 1:
-            self.settings.default_language = "eng"
-        else:
-            self.settings.default_language = "dan+eng"
-
-        # DPI
-        dpi_index = self.combo_dpi.currentIndex()
-        if dpi_index == 0:
-            self.settings.ocr_dpi = 150
-        elif dpi_index == 1:
-            self.settings.ocr_dpi = 300
-        else:
-            self.settings.ocr_dpi = 600
-
-        # Output directory
-        output_dir = self.edit_output_dir.text().strip()
-        if output_dir:
-            self.settings.output_directory = Path(output_dir)
-        else:
-            self.settings.output_directory = None
-
-        # Compression level
-        comp_index = self.combo_compression.currentIndex()
-        if comp_index == 0:
-            self.settings.compression_level = "high"
-        elif comp_index == 1:
-            self.settings.compression_level = "balanced"
-        else:
-            self.settings.compression_level = "maximum"
-
-        self.settings.sync()
+        # All changes are written to storage in one go
+        with self.settings.batch():
+            # Tesseract path
+            self.settings.tesseract_path = self.edit_tesseract.text().strip()
+
+            # Language and DPI
+            self.settings.default_language = self._LANGS[self.combo_language.currentIndex()]
+            self.settings.ocr_dpi = self._DPIS[self.combo_dpi.currentIndex()]
+
+            # Output directory
+            output_dir = self.edit_output_dir.text().strip()
+            if output_dir:
+                self.settings.output_directory = Path(output_dir)
+            else:
+                self.settings.output_directory = None
+
+            # Compression level
+            self.settings.compression_level = self._COMPRESSION_LEVELS[
+                self.combo_compression.currentIndex()
+            ]
 
         QMessageBox.information(
             self,
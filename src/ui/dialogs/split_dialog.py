@@ -2,6 +2,7 @@
 Dialog for splitting PDF files.
 """
 
+import threading
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -11,9 +12,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from src.ui.widgets.progress import ProgressWidget
+from src.ui.widgets.progress import ProgressWidget, ProgressThrottle
+from src.ui.workers import PdfInfoWorker
 from src.core.splitter import split_pdf, SplitMode, SplitOptions, SplitResult
-from src.core.pdf_handler import get_pdf_info
+from src.core.pdf_handler import PDFInfo
+from src.core.utils import parse_page_ranges
 
 
 class SplitWorker(QThread):
@@ -28,7 +31,8 @@ class SplitWorker(QThread):
         self.input_path = input_path
         self.output_dir = output_dir
         self.options = options
-        self._cancelled = False
+        self._cancel_event = threading.Event()
+        self._throttle = ProgressThrottle()
 
     def run(self):
         """Execute split in background thread."""
@@ -37,22 +41,23 @@ class SplitWorker(QThread):
                 self.input_path,
                 self.output_dir,
                 self.options,
-                progress_callback=self._on_progress
+                progress_callback=self._on_progress,
+                is_cancelled=self._cancel_event.is_set
             )
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.finished.emit(result)
         except Exception as e:
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.error.emit(str(e))
 
     def _on_progress(self, percent: int, message: str):
-        """Forward progress to signal."""
-        if not self._cancelled:
+        """Forward progress to signal, throttled to limit GUI thread wake-ups."""
+        if not self._cancel_event.is_set() and self._throttle.should_emit(percent, message):
             self.progress.emit(percent, message)
 
     def cancel(self):
-        """Request cancellation."""
-        self._cancelled = True
+        """Request cancellation; splitting stops before the next output file."""
+        self._cancel_event.set()
 
 
 class SplitDialog(QDialog):
@@ -63,16 +68,15 @@ class SplitDialog(QDialog):
         self.file_path = file_path
         self.output_dir: str | None = None
         self.worker: SplitWorker | None = None
+        self.pdf_info: PDFInfo | None = None
 
-        # Get PDF info
-        try:
-            self.pdf_info = get_pdf_info(file_path)
-        except Exception as e:
-            QMessageBox.critical(self, "Fejl", f"Kunne ikke læse PDF: {e}")
-            self.reject()
-            return
-
+        # Build the UI right away; page-dependent parts fill in once the
+        # PDF info has loaded in the background
         self._setup_ui()
+        self.info_worker = PdfInfoWorker(file_path)
+        self.info_worker.finished.connect(self._apply_pdf_info)
+        self.info_worker.error.connect(self._on_info_error)
+        self.info_worker.start()
 
     def _setup_ui(self):
         """Initialize dialog UI."""
@@ -88,7 +92,8 @@ class SplitDialog(QDialog):
 
         file_name = Path(self.file_path).name
         info_layout.addWidget(QLabel(f"📄 {file_name}"))
-        info_layout.addWidget(QLabel(f"Sider: {self.pdf_info.page_count}"))
+        self.pages_label = QLabel("Sider: indlæser...")
+        info_layout.addWidget(self.pages_label)
 
         layout.addWidget(info_group)
 
@@ -112,7 +117,7 @@ class SplitDialog(QDialog):
 
         self.spin_parts = QSpinBox()
         self.spin_parts.setMinimum(2)
-        self.spin_parts.setMaximum(self.pdf_info.page_count)
+        self.spin_parts.setMaximum(2)  # Raised once the page count is known
         self.spin_parts.setValue(2)
         self.spin_parts.setEnabled(False)
         parts_layout.addWidget(self.spin_parts)
@@ -147,11 +152,8 @@ class SplitDialog(QDialog):
 
         layout.addWidget(mode_group)
 
-        # Connect mode changes
-        self.radio_single.toggled.connect(self._on_mode_changed)
-        self.radio_equal.toggled.connect(self._on_mode_changed)
-        self.radio_ranges.toggled.connect(self._on_mode_changed)
-        self.radio_extract.toggled.connect(self._on_mode_changed)
+        # Connect mode changes - one group signal instead of one per radio
+        self.mode_group.buttonToggled.connect(self._on_mode_changed)
 
         # Output directory
         output_group = QGroupBox("Output mappe")
@@ -167,10 +169,9 @@ class SplitDialog(QDialog):
 
         layout.addWidget(output_group)
 
-        # Progress
-        self.progress = ProgressWidget()
-        self.progress.cancelled.connect(self._cancel)
-        layout.addWidget(self.progress)
+        # Progress - created on the first split, inserted at this position
+        self.progress: ProgressWidget | None = None
+        self._progress_index = layout.count()
 
         # Action buttons
         btn_layout = QHBoxLayout()
@@ -183,15 +184,37 @@ class SplitDialog(QDialog):
         self.btn_split = QPushButton("Split")
         self.btn_split.setProperty("class", "action-btn")
         self.btn_split.clicked.connect(self._start_split)
+        self.btn_split.setEnabled(False)  # Until the PDF info has loaded
         btn_layout.addWidget(self.btn_split)
 
         layout.addLayout(btn_layout)
 
-    def _on_mode_changed(self):
+    def _apply_pdf_info(self, pdf_info: PDFInfo):
+        """Fill in the page-dependent UI once the PDF info has loaded."""
+        self.pdf_info = pdf_info
+        self.pages_label.setText(f"Sider: {pdf_info.page_count}")
+        self.spin_parts.setMaximum(max(2, pdf_info.page_count))
+        self.btn_split.setEnabled(True)
+
+    def _on_info_error(self, message: str):
+        """Close the dialog if the PDF can't be read."""
+        QMessageBox.critical(self, "Fejl", f"Kunne ikke læse PDF: {message}")
+        self.reject()
+
+    def done(self, result: int):
+        """Wait for the info worker on every close path (accept, reject, X)."""
+        if self.info_worker.isRunning():
+            self.info_worker.wait()
+        super().done(result)
+
+    def _on_mode_changed(self, button, checked: bool):
         """Update UI when split mode changes."""
-        self.spin_parts.setEnabled(self.radio_equal.isChecked())
-        self.edit_ranges.setEnabled(self.radio_ranges.isChecked())
-        self.edit_extract.setEnabled(self.radio_extract.isChecked())
+        # Each switch toggles two buttons; only act on the newly checked one
+        if not checked:
+            return
+        self.spin_parts.setEnabled(button is self.radio_equal)
+        self.edit_ranges.setEnabled(button is self.radio_ranges)
+        self.edit_extract.setEnabled(button is self.radio_extract)
 
     def _browse_output(self):
         """Open directory dialog for output."""
@@ -232,8 +255,6 @@ class SplitDialog(QDialog):
             if not pages_str:
                 QMessageBox.warning(self, "Manglende input", "Angiv sider at udtrække.")
                 return None
-            # Parse pages string
-            from src.core.utils import parse_page_ranges
             pages = parse_page_ranges(pages_str, self.pdf_info.page_count)
             if not pages:
                 QMessageBox.warning(self, "Ugyldigt input", "Kunne ikke parse sidenumre.")
@@ -262,6 +283,7 @@ class SplitDialog(QDialog):
         # Disable UI during operation
         self.btn_split.setEnabled(False)
         self.btn_browse.setEnabled(False)
+        self._ensure_progress()
         self.progress.start("Starter split...")
 
         # Create and start worker
@@ -271,6 +293,13 @@ class SplitDialog(QDialog):
         self.worker.error.connect(self._on_error)
         self.worker.start()
 
+    def _ensure_progress(self):
+        """Create the progress widget the first time a split starts."""
+        if self.progress is None:
+            self.progress = ProgressWidget()
+            self.progress.cancelled.connect(self._cancel)
+            self.layout().insertWidget(self._progress_index, self.progress)
+
     def _on_finished(self, result: SplitResult):
         """Handle successful split."""
         self.progress.finish(f"Færdig! {len(result.output_files)} filer oprettet")
@@ -14,14 +14,38 @@ Note: Uses pre-rendered QPixmap cache to avoid QPainter conflicts
 that occur when multiple QSvgWidget instances render simultaneously.
 """
 
+import re
+
 from PyQt6.QtWidgets import QLabel
 from PyQt6.QtCore import QByteArray, Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QGuiApplication, QImage, QPixmap, QPixmapCache
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtGui import QPainter
 
-# Cache for pre-rendered pixmaps to avoid repeated SVG rendering
-_pixmap_cache: dict[tuple[str, int], QPixmap] = {}
+# Sizes the UI requests tool icons at (tool tiles); pre-rendered together
+_TOOL_ICON_SIZES = (40,)
+
+# One parsed renderer per SVG source, reused for every size it's drawn at
+_renderers: dict[str, QSvgRenderer] = {}
+
+# (icon_id, size) -> QPixmap for tool icons: the tile sizes are prewarmed on
+# first use (QPixmaps can't exist before the QApplication), other sizes are
+# added as requested. Bounded by len(TOOL_ICONS) x sizes in use.
+_tool_pixmaps: dict[tuple[str, int], QPixmap] | None = None
+_empty_pixmaps: dict[int, QPixmap] = {}
+
+# Whitespace between tags; the indented literals below are minified once
+_SVG_WS = re.compile(r">\s+<")
+
+
+def _minify(svg_string: str) -> str:
+    """Collapse inter-tag whitespace so less markup is encoded and parsed."""
+    return _SVG_WS.sub("><", svg_string.strip())
+
+
+def _themed(template: str) -> str:
+    """Fill the {GOLD}/{MINT} markers of an SVG template and minify it."""
+    return _minify(template.replace("{GOLD}", GOLD).replace("{MINT}", MINT))
 
 
 # =============================================================================
@@ -38,8 +62,9 @@ TEAL = "#2D5A5A"
 # TOOL ICONS (40x40 viewBox)
 # =============================================================================
 
-TOOL_ICONS = {
-    "ocr": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+# Plain templates with {GOLD}/{MINT} markers, filled in once by _themed()
+_TOOL_ICON_TEMPLATES = {
+    "ocr": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <ellipse cx="20" cy="20" rx="16" ry="10" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <circle cx="20" cy="20" r="6" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <circle cx="20" cy="20" r="2.5" fill="{MINT}"/>
@@ -49,7 +74,7 @@ TOOL_ICONS = {
         <line x1="20" y1="32" x2="20" y2="36" stroke="{GOLD}" stroke-width="1" opacity="0.6"/>
     </svg>''',
     
-    "merge": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "merge": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <rect x="5" y="8" width="14" height="18" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <rect x="21" y="8" width="14" height="18" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <path d="M20 28 L20 36 M15 32 L20 37 L25 32" stroke="{MINT}" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
@@ -59,7 +84,7 @@ TOOL_ICONS = {
         <line x1="24" y1="17" x2="32" y2="17" stroke="{MINT}" stroke-width="1"/>
     </svg>''',
     
-    "split": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "split": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <rect x="13" y="4" width="14" height="18" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <path d="M12 26 L6 34" stroke="{MINT}" stroke-width="1.5" stroke-linecap="round"/>
         <path d="M28 26 L34 34" stroke="{MINT}" stroke-width="1.5" stroke-linecap="round"/>
@@ -68,7 +93,7 @@ TOOL_ICONS = {
         <line x1="10" y1="22" x2="30" y2="22" stroke="{GOLD}" stroke-width="1" stroke-dasharray="2 2"/>
     </svg>''',
     
-    "compress": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "compress": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <path d="M8 12 L20 20 L8 28" stroke="{MINT}" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round" fill="none"/>
         <path d="M32 12 L20 20 L32 28" stroke="{MINT}" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round" fill="none"/>
         <rect x="16" y="14" width="8" height="12" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
@@ -78,7 +103,7 @@ TOOL_ICONS = {
         <circle cx="20" cy="34" r="2" fill="{GOLD}"/>
     </svg>''',
     
-    "convert": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "convert": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <rect x="4" y="10" width="12" height="16" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <text x="10" y="21" text-anchor="middle" fill="{MINT}" font-size="6" font-weight="bold" font-family="sans-serif">W</text>
         <path d="M18 18 L22 18 M20 15 L23 18 L20 21" stroke="{GOLD}" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
@@ -88,20 +113,20 @@ TOOL_ICONS = {
         <path d="M36 26 L36 30 L32 30" stroke="{GOLD}" stroke-width="1" fill="none"/>
     </svg>''',
     
-    "remove": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "remove": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <rect x="10" y="6" width="20" height="28" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <line x1="15" y1="16" x2="25" y2="26" stroke="{MINT}" stroke-width="2" stroke-linecap="round"/>
         <line x1="25" y1="16" x2="15" y2="26" stroke="{MINT}" stroke-width="2" stroke-linecap="round"/>
         <line x1="13" y1="10" x2="27" y2="10" stroke="{GOLD}" stroke-width="1" opacity="0.5"/>
     </svg>''',
     
-    "rotate": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "rotate": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <path d="M20 8 A12 12 0 1 1 8 20" stroke="{GOLD}" stroke-width="1.5" fill="none" stroke-linecap="round"/>
         <path d="M20 4 L20 12 L12 8 Z" fill="{MINT}"/>
         <rect x="15" y="15" width="10" height="12" rx="1" stroke="{GOLD}" stroke-width="1" fill="none"/>
     </svg>''',
     
-    "encrypt": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "encrypt": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <rect x="12" y="18" width="16" height="14" rx="2" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <path d="M15 18 L15 12 A5 5 0 0 1 25 12 L25 18" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <circle cx="20" cy="24" r="2" fill="{MINT}"/>
@@ -111,14 +136,14 @@ TOOL_ICONS = {
         <line x1="36" y1="25" x2="32" y2="25" stroke="{GOLD}" stroke-width="1" opacity="0.5"/>
     </svg>''',
     
-    "settings": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "settings": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <path d="M20 6 L22 10 L26 8 L26 13 L31 12 L28 17 L33 19 L28 23 L31 28 L26 27 L26 32 L22 30 L20 34 L18 30 L14 32 L14 27 L9 28 L12 23 L7 19 L12 17 L9 12 L14 13 L14 8 L18 10 Z"
               stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <circle cx="20" cy="20" r="5" stroke="{MINT}" stroke-width="1.5" fill="none"/>
         <circle cx="20" cy="20" r="2" fill="{MINT}"/>
     </svg>''',
 
-    "citation": f'''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
+    "citation": '''<svg viewBox="0 0 40 40" fill="none" xmlns="http://www.w3.org/2000/svg">
         <rect x="8" y="4" width="24" height="32" rx="2" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
         <path d="M8 10 L32 10" stroke="{GOLD}" stroke-width="1" opacity="0.5"/>
         <text x="14" y="20" fill="{MINT}" font-size="14" font-family="Georgia, serif">"</text>
@@ -128,13 +153,14 @@ TOOL_ICONS = {
         <circle cx="32" cy="4" r="3" fill="{GOLD}" opacity="0.4"/>
     </svg>''',
 }
+TOOL_ICONS = {icon_id: _themed(svg) for icon_id, svg in _TOOL_ICON_TEMPLATES.items()}
 
 
 # =============================================================================
 # DROP ZONE ICON (50x50)
 # =============================================================================
 
-DROP_ZONE_ICON = f'''<svg viewBox="0 0 50 50" fill="none" xmlns="http://www.w3.org/2000/svg">
+_DROP_ZONE_TEMPLATE = '''<svg viewBox="0 0 50 50" fill="none" xmlns="http://www.w3.org/2000/svg">
     <rect x="12" y="6" width="26" height="34" rx="2" stroke="{GOLD}" stroke-width="2" fill="none"/>
     <path d="M30 6 L38 14 L30 14 Z" fill="{MINT}" stroke="{GOLD}" stroke-width="1"/>
     <line x1="25" y1="22" x2="25" y2="34" stroke="{MINT}" stroke-width="2" stroke-linecap="round"/>
@@ -142,19 +168,21 @@ DROP_ZONE_ICON = f'''<svg viewBox="0 0 50 50" fill="none" xmlns="http://www.w3.o
     <circle cx="6" cy="23" r="2" fill="{GOLD}" opacity="0.5"/>
     <circle cx="44" cy="23" r="2" fill="{GOLD}" opacity="0.5"/>
 </svg>'''
+DROP_ZONE_ICON = _themed(_DROP_ZONE_TEMPLATE)
 
 
 # =============================================================================
 # FILE ICON (28x28)
 # =============================================================================
 
-FILE_ICON = f'''<svg viewBox="0 0 28 28" fill="none" xmlns="http://www.w3.org/2000/svg">
+_FILE_TEMPLATE = '''<svg viewBox="0 0 28 28" fill="none" xmlns="http://www.w3.org/2000/svg">
     <rect x="4" y="2" width="16" height="22" rx="1" stroke="{GOLD}" stroke-width="1.5" fill="none"/>
     <path d="M14 2 L20 8 L14 8 Z" fill="{MINT}"/>
     <line x1="7" y1="12" x2="17" y2="12" stroke="{MINT}" stroke-width="1"/>
     <line x1="7" y1="16" x2="17" y2="16" stroke="{MINT}" stroke-width="1"/>
     <line x1="7" y1="20" x2="13" y2="20" stroke="{MINT}" stroke-width="1"/>
 </svg>'''
+FILE_ICON = _themed(_FILE_TEMPLATE)
 
 
 # =============================================================================
@@ -164,7 +192,8 @@ FILE_ICON = f'''<svg viewBox="0 0 28 28" fill="none" xmlns="http://www.w3.org/20
 def svg_to_pixmap(svg_string: str, size: int) -> QPixmap:
     """
     Convert SVG string to QPixmap with caching.
-    Uses a cache to avoid repeated rendering and QPainter conflicts.
+    Uses Qt's bounded QPixmapCache to avoid repeated rendering and QPainter
+    conflicts; an evicted icon is simply rendered again.
 
     Args:
         svg_string: The SVG markup
@@ -173,23 +202,61 @@ def svg_to_pixmap(svg_string: str, size: int) -> QPixmap:
     Returns:
         QPixmap rendered from the SVG (cached)
     """
-    # Use hash of svg_string for cache key
-    cache_key = (hash(svg_string), size)
+    # Use hash of svg_string for cache key; the ratio keeps HiDPI renders apart
+    dpr = _device_pixel_ratio()
+    cache_key = f"icon:{hash(svg_string)}:{size}:{dpr}"
+
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is not None:
+        return pixmap
+
+    # Render once and cache the result
+    pixmap = _render_svg(svg_string, size, dpr)
+    QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+def _get_renderer(svg_string: str) -> QSvgRenderer:
+    """Parse SVG markup once; the renderer scales to any target size."""
+    renderer = _renderers.get(svg_string)
+    if renderer is None:
+        renderer = QSvgRenderer(QByteArray(svg_string.encode('utf-8')))
+        _renderers[svg_string] = renderer
+    return renderer
 
-    if cache_key in _pixmap_cache:
-        return _pixmap_cache[cache_key]
 
-    # Render SVG to pixmap
-    renderer = QSvgRenderer(QByteArray(svg_string.encode('utf-8')))
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.GlobalColor.transparent)
-    painter = QPainter(pixmap)
+def _device_pixel_ratio() -> float:
+    """Pixel ratio of the primary screen (1.0 if there is none yet)."""
+    screen = QGuiApplication.primaryScreen()
+    return screen.devicePixelRatio() if screen is not None else 1.0
+
+
+def _render_svg(svg_string: str, size: int, dpr: float = 1.0) -> QPixmap:
+    """
+    Render SVG markup to a transparent square QPixmap of logical size.
+
+    The image is rasterized at size * dpr physical pixels and tagged with
+    the ratio, so Qt paints it 1:1 on HiDPI screens instead of upscaling.
+    """
+    renderer = _get_renderer(svg_string)
+    physical = round(size * dpr)
+    image = QImage(physical, physical, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
     renderer.render(painter)
     painter.end()
+    image.setDevicePixelRatio(dpr)
+    return QPixmap.fromImage(image)
 
-    # Cache the result
-    _pixmap_cache[cache_key] = pixmap
-    return pixmap
+
+def _prewarm_tool_icons() -> dict[tuple[str, int], QPixmap]:
+    """Render every tool icon at every tile size in one go."""
+    dpr = _device_pixel_ratio()
+    return {
+        (icon_id, size): _render_svg(svg_string, size, dpr)
+        for icon_id, svg_string in TOOL_ICONS.items()
+        for size in _TOOL_ICON_SIZES
+    }
 
 
 def get_icon_pixmap(icon_id: str, size: int = 40) -> QPixmap:
@@ -203,12 +270,43 @@ def get_icon_pixmap(icon_id: str, size: int = 40) -> QPixmap:
     Returns:
         QPixmap with the icon, or empty pixmap if not found
     """
-    svg_string = TOOL_ICONS.get(icon_id, '')
-    if not svg_string:
+    global _tool_pixmaps
+    if _tool_pixmaps is None:
+        _tool_pixmaps = _prewarm_tool_icons()
+
+    pixmap = _tool_pixmaps.get((icon_id, size))
+    if pixmap is not None:
+        return pixmap
+
+    svg_string = TOOL_ICONS.get(icon_id)
+    if svg_string is None:
+        return _empty_pixmap(size)
+    # Unusual size: render once, then it's a single lookup like the rest
+    pixmap = _render_svg(svg_string, size, _device_pixel_ratio())
+    _tool_pixmaps[(icon_id, size)] = pixmap
+    return pixmap
+
+
+def _empty_pixmap(size: int) -> QPixmap:
+    """Shared transparent pixmap returned for unknown icon IDs."""
+    pixmap = _empty_pixmaps.get(size)
+    if pixmap is None:
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
-        return pixmap
-    return svg_to_pixmap(svg_string, size)
+        _empty_pixmaps[size] = pixmap
+    return pixmap
+
+
+def _pixmap_label(pixmap: QPixmap, size: int) -> QLabel:
+    """Wrap a pixmap in a fixed-size, centered QLabel."""
+    label = QLabel()
+    label.setFixedSize(size, size)
+    # No per-label stylesheet (parsed and polished on every call): callers
+    # whose parent stylesheet sets a background override it themselves
+    label.setAutoFillBackground(False)
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    label.setPixmap(pixmap)
+    return label
 
 
 def get_icon_widget(icon_id: str, size: int = 40) -> QLabel:
@@ -223,34 +321,17 @@ def get_icon_widget(icon_id: str, size: int = 40) -> QLabel:
     Returns:
         QLabel with the icon pixmap
     """
-    label = QLabel()
-    label.setFixedSize(size, size)
-    label.setStyleSheet("background: transparent;")
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-    pixmap = get_icon_pixmap(icon_id, size)
-    label.setPixmap(pixmap)
-    return label
+    return _pixmap_label(get_icon_pixmap(icon_id, size), size)
 
 
 def get_drop_zone_icon(size: int = 50) -> QLabel:
     """Get the drop zone icon widget as QLabel with pixmap."""
-    label = QLabel()
-    label.setFixedSize(size, size)
-    label.setStyleSheet("background: transparent;")
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    label.setPixmap(svg_to_pixmap(DROP_ZONE_ICON, size))
-    return label
+    return _pixmap_label(svg_to_pixmap(DROP_ZONE_ICON, size), size)
 
 
 def get_file_icon(size: int = 28) -> QLabel:
     """Get the file icon widget as QLabel with pixmap."""
-    label = QLabel()
-    label.setFixedSize(size, size)
-    label.setStyleSheet("background: transparent;")
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    label.setPixmap(svg_to_pixmap(FILE_ICON, size))
-    return label
+    return _pixmap_label(svg_to_pixmap(FILE_ICON, size), size)
 
 
 def get_svg_widget(svg_string: str, size: int = 40) -> QLabel:
@@ -265,9 +346,4 @@ def get_svg_widget(svg_string: str, size: int = 40) -> QLabel:
     Returns:
         QLabel with the rendered SVG
     """
-    label = QLabel()
-    label.setFixedSize(size, size)
-    label.setStyleSheet("background: transparent;")
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    label.setPixmap(svg_to_pixmap(svg_string, size))
-    return label
+    return _pixmap_label(svg_to_pixmap(svg_string, size), size)
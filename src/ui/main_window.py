@@ -18,58 +18,55 @@ from PyQt6.QtWidgets import QGraphicsDropShadowEffect
 from src.ui.widgets.drop_zone import DropZone
 from src.ui.widgets.file_list import FileListWidget
 from src.ui.widgets.tool_tile import ToolTile
-from src.ui.dialogs.merge_dialog import MergeDialog
-from src.ui.dialogs.split_dialog import SplitDialog
-from src.ui.dialogs.convert_dialog import ConvertDialog
-from src.ui.dialogs.settings_dialog import SettingsDialog
-from src.ui.dialogs.ocr_dialog import OCRDialog
-from src.ui.dialogs.compress_dialog import CompressDialog
-from src.ui.dialogs.rotate_dialog import RotateDialog
-from src.ui.dialogs.remove_dialog import RemoveDialog
-from src.ui.dialogs.encrypt_dialog import EncryptDialog
-from src.ui.dialogs.citation_dialog import CitationDialog
+from src.ui.widgets.progress import ProgressWidget
 from src.config.constants import TOOLS, SUPPORTED_EXTENSIONS
+# Dialogs are imported in their _show_* methods: they pull in PyMuPDF,
+# Tesseract bindings and Pillow, which the main window doesn't need to appear
+
+
+# Gradient for the decorative lines - one rule parsed once for all four
+_DECO_LINES_QSS = """
+    QFrame#deco-vline {
+        background: qlineargradient(y1:0, y2:1,
+            stop:0 transparent,
+            stop:0.3 rgba(45, 90, 90, 51),
+            stop:0.5 rgba(127, 191, 181, 51),
+            stop:0.7 rgba(45, 90, 90, 51),
+            stop:1 transparent);
+    }
+"""
 
 
-class ArtDecoLines(QWidget):
+class ArtDecoLines:
     """
-    Decorative vertical lines overlay matching HTML .art-deco-lines.
+    Decorative vertical lines matching HTML .art-deco-lines.
     4 vertical gradient lines at 5%, 12%, 88%, 95% positions.
     Uses QFrame widgets instead of custom painting to avoid QPainter conflicts.
+
+    The frames are children of the given parent, stacked beneath its other
+    children, rather than of a full-window translucent overlay that would
+    need an extra composited paint pass on every update. The parent's
+    stylesheet must include _DECO_LINES_QSS.
     """
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+    POSITIONS = (0.05, 0.12, 0.88, 0.95)
 
+    def __init__(self, parent: QWidget):
         # Create 4 vertical line frames
         self._lines = []
-        positions = [0.05, 0.12, 0.88, 0.95]
-
-        for pos in positions:
-            line = QFrame(self)
+        for pos in self.POSITIONS:
+            line = QFrame(parent)
+            line.setObjectName("deco-vline")
             line.setFixedWidth(1)
             line.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            line.setStyleSheet("""
-                background: qlineargradient(y1:0, y2:1,
-                    stop:0 transparent,
-                    stop:0.3 rgba(45, 90, 90, 51),
-                    stop:0.5 rgba(127, 191, 181, 51),
-                    stop:0.7 rgba(45, 90, 90, 51),
-                    stop:1 transparent);
-            """)
+            line.lower()  # Behind the (transparent) scroll area
             self._lines.append((line, pos))
 
-    def resizeEvent(self, event):
-        """Position lines on resize."""
-        super().resizeEvent(event)
-        h = self.height()
-        w = self.width()
-
+    def set_size(self, width: int, height: int):
+        """Position lines for the given area size."""
         for line, pos in self._lines:
-            x = int(w * pos)
-            line.setGeometry(x, 0, 1, h)
+            x = int(width * pos)
+            line.setGeometry(x, 0, 1, height)
 
 
 def get_resource_path(relative_path: str) -> str:
@@ -140,6 +137,7 @@ class MainWindow(QMainWindow):
 
     def __init__(self):
         super().__init__()
+        self._shared_progress: ProgressWidget | None = None
         self._setup_ui()
         self._setup_shortcuts()
 
@@ -149,9 +147,9 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(420, 550)
         self.resize(900, 800)
 
-        # Container for scroll area + decorative overlay
+        # Container for scroll area + decorative lines
         container = QWidget()
-        container.setStyleSheet("background: transparent;")
+        container.setStyleSheet("* { background: transparent; }" + _DECO_LINES_QSS)
         self.setCentralWidget(container)
 
         # Use a stacked layout approach - scroll area is the base
@@ -166,10 +164,9 @@ class MainWindow(QMainWindow):
         scroll_area.setStyleSheet("QScrollArea { border: none; background: transparent; }")
         container_layout.addWidget(scroll_area)
 
-        # Decorative vertical lines overlay (fixed position)
+        # Decorative vertical lines (fixed position, beneath the content)
         self._deco_lines = ArtDecoLines(container)
-        self._deco_lines.setGeometry(0, 0, self.width(), self.height())
-        self._deco_lines.raise_()  # Keep on top but transparent to mouse
+        self._deco_lines.set_size(self.width(), self.height())
 
         # Content widget
         content_widget = QWidget()
@@ -307,9 +304,9 @@ class MainWindow(QMainWindow):
         """Handle window resize for responsive layout."""
         super().resizeEvent(event)
 
-        # Resize decorative lines overlay
+        # Reposition decorative lines
         if hasattr(self, '_deco_lines'):
-            self._deco_lines.setGeometry(0, 0, event.size().width(), event.size().height())
+            self._deco_lines.set_size(event.size().width(), event.size().height())
 
         available_width = event.size().width() - 80
         self.tools_grid.update_columns(available_width)
@@ -465,6 +462,7 @@ class MainWindow(QMainWindow):
         if len(files) < 2:
             QMessageBox.information(self, "For få filer", "Tilføj mindst 2 PDF filer for at merge.")
             return
+        from src.ui.dialogs.merge_dialog import MergeDialog
         dialog = MergeDialog(files, self)
         dialog.exec()
 
@@ -473,6 +471,7 @@ class MainWindow(QMainWindow):
         if not pdf_files:
             QMessageBox.information(self, "Ingen PDF filer", "Tilføj en PDF fil for at splitte.")
             return
+        from src.ui.dialogs.split_dialog import SplitDialog
         dialog = SplitDialog(pdf_files[0], self)
         dialog.exec()
 
@@ -481,9 +480,16 @@ class MainWindow(QMainWindow):
         if not docx_files:
             QMessageBox.information(self, "Ingen Word-filer", "Tilføj Word-filer (.docx) for at konvertere til PDF.")
             return
-        dialog = ConvertDialog(docx_files, self)
+        from src.ui.dialogs.convert_dialog import ConvertDialog
+        dialog = ConvertDialog(docx_files, self, progress_widget=self._get_shared_progress())
         dialog.exec()
 
+    def _get_shared_progress(self) -> ProgressWidget:
+        """Return the progress widget shared by dialogs, created on first use."""
+        if self._shared_progress is None:
+            self._shared_progress = ProgressWidget()
+        return self._shared_progress
+
     def _show_ocr_dialog(self, files: list[str]):
         """Show OCR dialog for text recognition."""
         # Filter to supported files (PDF and images)
@@ -498,6 +504,7 @@ class MainWindow(QMainWindow):
             )
             return
 
+        from src.ui.dialogs.ocr_dialog import OCRDialog
         dialog = OCRDialog(ocr_files, self)
         dialog.exec()
 
@@ -507,6 +514,7 @@ class MainWindow(QMainWindow):
         if not pdf_files:
             QMessageBox.information(self, "Ingen PDF filer", "Tilføj en PDF fil for at komprimere.")
             return
+        from src.ui.dialogs.compress_dialog import CompressDialog
         dialog = CompressDialog(pdf_files, self)
         dialog.exec()
 
@@ -516,6 +524,7 @@ class MainWindow(QMainWindow):
         if not pdf_files:
             QMessageBox.information(self, "Ingen PDF filer", "Tilføj en PDF fil for at rotere sider.")
             return
+        from src.ui.dialogs.rotate_dialog import RotateDialog
         dialog = RotateDialog(pdf_files, self)
         dialog.exec()
 
@@ -525,6 +534,7 @@ class MainWindow(QMainWindow):
         if not pdf_files:
             QMessageBox.information(self, "Ingen PDF filer", "Tilføj en PDF fil for at fjerne sider.")
             return
+        from src.ui.dialogs.remove_dialog import RemoveDialog
         dialog = RemoveDialog(pdf_files, self)
         dialog.exec()
 
@@ -534,6 +544,7 @@ class MainWindow(QMainWindow):
         if not pdf_files:
             QMessageBox.information(self, "Ingen PDF filer", "Tilføj en PDF fil for at kryptere.")
             return
+        from src.ui.dialogs.encrypt_dialog import EncryptDialog
         dialog = EncryptDialog(pdf_files, self)
         dialog.exec()
 
@@ -543,10 +554,12 @@ class MainWindow(QMainWindow):
         if not pdf_files:
             QMessageBox.information(self, "Ingen PDF filer", "Tilføj en PDF fil for at udtrække citationer.")
             return
+        from src.ui.dialogs.citation_dialog import CitationDialog
         dialog = CitationDialog(pdf_files, self)
         dialog.exec()
 
     def _show_settings(self):
+        from src.ui.dialogs.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self)
         dialog.exec()
 
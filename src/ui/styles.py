@@ -4,9 +4,9 @@ Matches the pdf-toolkit-unified.html reference design.
 """
 
 
-def get_stylesheet() -> str:
-    """Return the main application stylesheet with Art Deco theme."""
-    return """
+# Main application stylesheet with Art Deco theme. Built once at import so
+# app startup only hands a ready string to QApplication.setStyleSheet().
+STYLESHEET = """
 /* ============================================
    METROPOLIS / ART DECO THEME
    Matches HTML reference design
@@ -530,3 +530,8 @@ QFrame#deco-line {
     min-height: 2px;
 }
 """
+
+
+def get_stylesheet() -> str:
+    """Return the main application stylesheet with Art Deco theme."""
+    return STYLESHEET
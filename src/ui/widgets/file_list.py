@@ -38,6 +38,8 @@ class FileItemWidget(QWidget):
 
         # File icon - pre-rendered 28x28 pixmap (avoids QPainter conflicts)
         icon_widget = get_file_icon(28)
+        # Keeps the row's hover background from cascading onto the icon
+        icon_widget.setStyleSheet("background: transparent;")
         layout.addWidget(icon_widget)
 
         # File info
@@ -2,6 +2,9 @@
 Progress indicator widgets for long-running operations.
 """
 
+import re
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QProgressBar, QLabel, QPushButton
@@ -9,6 +12,38 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal
 
 
+class ProgressThrottle:
+    """
+    Rate limiter for worker progress callbacks.
+
+    Lets at most one update through per interval, so per-page callbacks
+    don't flood the GUI thread with queued signals and progress bar
+    repaints. The start (0) and end (100) updates always pass, and so does
+    the first update of a new phase (e.g. "Gemmer fil..."), so a short
+    step is never hidden behind the previous one's counter.
+    """
+
+    # Counters ("side 3/10") don't start a new phase
+    _COUNTER_RE = re.compile(r"\d+")
+
+    def __init__(self, interval_ms: int = 100):
+        self._interval_ns = interval_ms * 1_000_000
+        self._last_emit_ns: int | None = None
+        self._phase: str | None = None
+
+    def should_emit(self, percent: int, message: str) -> bool:
+        """Return True if this update should be forwarded to the UI."""
+        now = time.monotonic_ns()
+        phase = self._COUNTER_RE.sub("", message)
+        if (percent <= 0 or percent >= 100 or self._last_emit_ns is None
+                or phase != self._phase
+                or now - self._last_emit_ns >= self._interval_ns):
+            self._last_emit_ns = now
+            self._phase = phase
+            return True
+        return False
+
+
 class ProgressWidget(QWidget):
     """
     Widget showing operation progress with status text and cancel button.
@@ -0,0 +1,6 @@
+"""PDF Toolkit background workers shared by several dialogs."""
+
+from .info import PdfInfoWorker
+from .pool import process_event, process_pool, shared_process_pool
+
+__all__ = ['PdfInfoWorker', 'process_event', 'process_pool', 'shared_process_pool']
@@ -0,0 +1,25 @@
+"""
+Background loading of PDF metadata.
+"""
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.core.pdf_handler import get_pdf_info
+
+
+class PdfInfoWorker(QThread):
+    """Reads PDFInfo off the UI thread so dialogs can open immediately."""
+
+    finished = pyqtSignal(object)  # PDFInfo
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str):
+        super().__init__()
+        self.file_path = file_path
+
+    def run(self):
+        """Open the PDF (or hit the info cache) in background thread."""
+        try:
+            self.finished.emit(get_pdf_info(self.file_path))
+        except Exception as e:
+            self.error.emit(str(e))
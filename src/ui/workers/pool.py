@@ -0,0 +1,59 @@
+"""
+Process pools for PyMuPDF/Tesseract work started from background QThreads.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# Pools are created from QThreads. Forking a multi-threaded Qt process can
+# deadlock the child, so workers are always spawned; freeze_support() in
+# main.py makes this work in frozen builds too.
+_SPAWN = multiprocessing.get_context("spawn")
+
+# Long-lived pool for short, frequent jobs; bounded to limit MuPDF memory use
+_SHARED_MAX_WORKERS = 4
+_shared_pool: ProcessPoolExecutor | None = None
+_shared_pool_lock = threading.Lock()
+
+
+def process_pool(max_workers: int, **kwargs) -> ProcessPoolExecutor:
+    """
+    Create a process pool that spawns its workers.
+
+    Args:
+        max_workers: Number of worker processes
+        **kwargs: Passed on to ProcessPoolExecutor (e.g. initializer)
+
+    Returns:
+        ProcessPoolExecutor using the spawn start method
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=_SPAWN, **kwargs)
+
+
+def process_event():
+    """
+    Create an event that process pool workers can observe.
+
+    Events can't be sent with submitted jobs; pass this one through the
+    pool's initializer arguments instead.
+    """
+    return _SPAWN.Event()
+
+
+def shared_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the session-wide process pool, creating it on first use.
+
+    Spawned workers each start a fresh interpreter, so short jobs that run
+    often (e.g. thumbnail rendering on every dialog open) share this pool
+    instead of paying that startup cost per job. Callers must not shut it
+    down; cancel their own futures instead.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        # A crashed worker leaves the pool unusable; replace it
+        if _shared_pool is None or _shared_pool._broken:
+            _shared_pool = process_pool(min(os.cpu_count() or 1, _SHARED_MAX_WORKERS))
+        return _shared_pool